@@ -0,0 +1,89 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from customer import CustomerTable
+from scheduling_algorithms import simulate_sjf, simulate_srtf, simulate_rr, simulate_fcfs, simulate_priority, simulate_mlfq, simulate_lottery, simulate_stride
+from metrics import calculate_metrics
+from workload import BURST_DISTRIBUTIONS, generate_workload, read_trace, write_trace
+
+POLICIES = {
+    "FCFS": simulate_fcfs,
+    "SJF": simulate_sjf,
+    "SRTF": simulate_srtf,
+    "Priority": simulate_priority,
+    "MLFQ": simulate_mlfq,
+    "RR": simulate_rr,
+    "Lottery": simulate_lottery,
+    "Stride": simulate_stride,
+}
+QUANTUM_POLICIES = ("RR", "Lottery", "Stride")
+
+_workload = None
+
+def _load_workload(workload):
+    global _workload
+    _workload = workload
+
+def _run_policy(name, quantum, tellers, context_switch, aging):
+    # Each task rebuilds its own customers from the worker's copy of the
+    # workload, so policies never share mutable state.
+    customers = CustomerTable(*_workload)
+    policy = name.split()[0]
+    if policy in QUANTUM_POLICIES:
+        POLICIES[policy](customers, quantum, context_switch=context_switch, tellers=tellers)
+    elif policy == "Priority":
+        POLICIES[policy](customers, aging, context_switch=context_switch, tellers=tellers)
+    else:
+        POLICIES[policy](customers, context_switch=context_switch, tellers=tellers)
+    return calculate_metrics(customers)
+
+def run_batch(customers, quanta=(1, 2, 4), tellers=1, context_switch=0, aging=0, max_workers=None):
+    if isinstance(customers, CustomerTable):
+        workload = (customers.arrival_time, customers.burst_time, customers.id, customers.priority)
+    else:
+        workload = ([customer.arrival_time for customer in customers], [customer.burst_time for customer in customers],
+                    [customer.id for customer in customers], [customer.priority for customer in customers])
+    runs = [(name, None) for name in POLICIES if name not in QUANTUM_POLICIES]
+    runs += [(f"{name} (q={quantum})", quantum) for name in QUANTUM_POLICIES for quantum in quanta]
+
+    # The workload is shipped once per worker process rather than once per run.
+    with ProcessPoolExecutor(max_workers, initializer=_load_workload, initargs=(workload,)) as executor:
+        futures = [executor.submit(_run_policy, name, quantum, tellers, context_switch, aging) for name, quantum in runs]
+        return {name: future.result() for (name, _), future in zip(runs, futures)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Run every scheduling policy over one shared workload.")
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival-rate", type=float, default=1.0)
+    parser.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--mean-burst", type=float, default=0.9)
+    parser.add_argument("--trace", help="replay this .bin/.csv trace instead of generating a workload")
+    parser.add_argument("--write-trace", help="save the generated workload to this .bin/.csv trace")
+    parser.add_argument("--quanta", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--tellers", type=int, default=1)
+    parser.add_argument("--context-switch", type=float, default=0)
+    parser.add_argument("--aging", type=float, default=0, help="priority levels a waiting customer gains per time unit")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--plot", action="store_true")
+    args = parser.parse_args()
+
+    if args.trace:
+        arrivals, bursts, priorities = read_trace(args.trace)
+    else:
+        arrivals, bursts, priorities = generate_workload(args.customers, args.seed, args.arrival_rate, args.burst, args.mean_burst)
+        if args.write_trace:
+            write_trace(args.write_trace, arrivals, bursts, priorities)
+    customers = CustomerTable(arrivals, bursts, priorities=priorities)
+    results = run_batch(customers, args.quanta, args.tellers, args.context_switch, args.aging, args.workers)
+
+    print(f"{'Algorithm':<16}{'Turnaround':>14}{'Waiting':>14}{'Response':>14}{'p99 Turnaround':>16}{'Throughput':>12}{'Fairness':>10}")
+    for name, metrics in results.items():
+        print(f"{name:<16}{metrics.avg_turnaround_time:>14.3f}{metrics.avg_waiting_time:>14.3f}{metrics.avg_response_time:>14.3f}"
+              f"{metrics.p99_turnaround_time:>16.3f}{metrics.throughput:>12.3f}{metrics.fairness:>10.3f}")
+
+    if args.plot:
+        from visualization import visualize_results
+        visualize_results(results)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,121 @@
+import math
+import random
+from array import array
+
 class Customer:
-    def __init__(self, id, arrival_time):
+    __slots__ = ("id", "arrival_time", "burst_time", "priority", "remaining_time", "slices", "start_time", "end_time")
+
+    def __init__(self, id, arrival_time, burst_time=None, priority=0):
         self.id = id
         self.arrival_time = arrival_time
+        if burst_time is None:
+            burst_time = random.randint(1, 5)
+        self.burst_time = burst_time
+        # Lower numbers are served first by the priority-based schedulers.
+        self.priority = priority
+        self.remaining_time = burst_time
+        self.slices = 0
         self.start_time = None
         self.end_time = None
 
     def __repr__(self):
-        return f"Customer(id={self.id}, arrival_time={self.arrival_time}, start_time={self.start_time}, end_time={self.end_time})"
+        return f"Customer(id={self.id}, arrival_time={self.arrival_time}, burst_time={self.burst_time}, slices={self.slices}, start_time={self.start_time}, end_time={self.end_time})"
+
+class CustomerTable:
+    # Struct-of-arrays store: one typed column per field instead of one object
+    # per customer. Unset start/end times are NaN in the columns.
+    def __init__(self, arrivals, bursts, ids=None, priorities=None):
+        self.arrival_time = array('d', arrivals)
+        self.burst_time = array('d', bursts)
+        if len(self.arrival_time) != len(self.burst_time):
+            raise ValueError("Arrival and burst columns must have the same length.")
+        self.id = array('q', range(len(self.arrival_time)) if ids is None else ids)
+        self.priority = array('q', [0]) * len(self.arrival_time) if priorities is None else array('q', priorities)
+        self.reset()
+
+    def reset(self):
+        n = len(self.arrival_time)
+        self.remaining_time = array('d', self.burst_time)
+        self.slices = array('q', [0]) * n
+        self.start_time = array('d', [math.nan]) * n
+        self.end_time = array('d', [math.nan]) * n
+
+    def __len__(self):
+        return len(self.arrival_time)
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("CustomerTable index out of range")
+        return CustomerRow(self, index % len(self))
+
+    def __iter__(self):
+        return (CustomerRow(self, index) for index in range(len(self)))
+
+    def arrival_order(self):
+        # Rows are created lazily, so only customers currently in the system
+        # exist as objects while a scheduler runs over the table.
+        arrival_time = self.arrival_time
+        if all(arrival_time[i] <= arrival_time[i + 1] for i in range(len(self) - 1)):
+            return iter(self)
+        return (CustomerRow(self, index) for index in sorted(range(len(self)), key=arrival_time.__getitem__))
+
+class CustomerRow:
+    # Customer-compatible view of one row of a CustomerTable.
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def id(self):
+        return self.table.id[self.index]
+
+    @property
+    def arrival_time(self):
+        return self.table.arrival_time[self.index]
+
+    @property
+    def burst_time(self):
+        return self.table.burst_time[self.index]
+
+    @property
+    def priority(self):
+        return self.table.priority[self.index]
+
+    @property
+    def remaining_time(self):
+        return self.table.remaining_time[self.index]
+
+    @remaining_time.setter
+    def remaining_time(self, value):
+        self.table.remaining_time[self.index] = value
+
+    @property
+    def slices(self):
+        return self.table.slices[self.index]
+
+    @slices.setter
+    def slices(self, value):
+        self.table.slices[self.index] = value
+
+    @property
+    def start_time(self):
+        value = self.table.start_time[self.index]
+        return None if math.isnan(value) else value
+
+    @start_time.setter
+    def start_time(self, value):
+        self.table.start_time[self.index] = math.nan if value is None else value
+
+    @property
+    def end_time(self):
+        value = self.table.end_time[self.index]
+        return None if math.isnan(value) else value
+
+    @end_time.setter
+    def end_time(self, value):
+        self.table.end_time[self.index] = math.nan if value is None else value
+
+    def __repr__(self):
+        return f"Customer(id={self.id}, arrival_time={self.arrival_time}, burst_time={self.burst_time}, slices={self.slices}, start_time={self.start_time}, end_time={self.end_time})"
@@ -1,17 +1,19 @@
-import time
 import random
-from customer import Customer
-from scheduling_algorithms import simulate_sjf, simulate_srtf, simulate_rr, simulate_fcfs
+from scheduling_algorithms import simulate_sjf, simulate_srtf, simulate_rr, simulate_fcfs, simulate_priority, simulate_mlfq, simulate_lottery, simulate_stride
 from metrics import calculate_metrics
 from visualization import visualize_results
+from workload import generate_workload, make_customers
 
 def reset_customers(customers):
     for customer in customers:
+        customer.remaining_time = customer.burst_time
+        customer.slices = 0
         customer.start_time = None
         customer.end_time = None
 
 def main():
-    customers = [Customer(i, time.time()) for i in range(5)]
+    customers = make_customers(*generate_workload(5, seed=random.randrange(2 ** 32), mean_burst=3))
+    results = {}
     
     while True:
         print("Choose a scheduling algorithm:")
@@ -19,37 +21,72 @@ def main():
         print("2. Shortest Job First (SJF)")
         print("3. Shortest Remaining Time First (SRTF)")
         print("4. Round Robin (RR)")
-        choice = input("Enter your choice (1/2/3/4): ")
+        print("5. Priority with Aging")
+        print("6. Multilevel Feedback Queue (MLFQ)")
+        print("7. Lottery")
+        print("8. Stride")
+        choice = input("Enter your choice (1-8): ")
+
+        num_tellers = 1
+        if choice in ('1', '2', '3', '4', '5', '6', '7', '8'):
+            num_tellers = int(input("Enter the number of tellers: ") or 1)
 
         reset_customers(customers)
         
-        results = {}
-        
         if choice == '1':
-            simulate_fcfs(customers)
+            tellers = simulate_fcfs(customers, verbose=True, tellers=num_tellers)
             fcfs_results = calculate_metrics(customers)
             results["FCFS"] = fcfs_results
             print(f"FCFS Metrics: {fcfs_results}")
         elif choice == '2':
-            simulate_sjf(customers)
+            tellers = simulate_sjf(customers, verbose=True, tellers=num_tellers)
             sjf_results = calculate_metrics(customers)
             results["SJF"] = sjf_results
             print(f"SJF Metrics: {sjf_results}")
         elif choice == '3':
-            simulate_srtf(customers)
+            tellers = simulate_srtf(customers, verbose=True, tellers=num_tellers)
             srtf_results = calculate_metrics(customers)
             results["SRTF"] = srtf_results
             print(f"SRTF Metrics: {srtf_results}")
         elif choice == '4':
             quantum = int(input("Enter the quantum time: "))
-            simulate_rr(customers, quantum)
+            context_switch = float(input("Enter the context switch time: ") or 0)
+            tellers = simulate_rr(customers, quantum, verbose=True, context_switch=context_switch, tellers=num_tellers)
             rr_results = calculate_metrics(customers)
             results["RR"] = rr_results
             print(f"RR Metrics: {rr_results}")
+            print(f"RR Slices: {dict((customer.id, customer.slices) for customer in customers)}")
+        elif choice == '5':
+            aging = float(input("Enter the aging rate: ") or 0)
+            tellers = simulate_priority(customers, aging, verbose=True, tellers=num_tellers)
+            priority_results = calculate_metrics(customers)
+            results["Priority"] = priority_results
+            print(f"Priority Metrics: {priority_results}")
+        elif choice == '6':
+            quanta = tuple(map(float, input("Enter the quantum for each level (comma separated): ").split(',')))
+            tellers = simulate_mlfq(customers, quanta, verbose=True, tellers=num_tellers)
+            mlfq_results = calculate_metrics(customers)
+            results["MLFQ"] = mlfq_results
+            print(f"MLFQ Metrics: {mlfq_results}")
+        elif choice == '7':
+            quantum = int(input("Enter the quantum time: "))
+            tellers = simulate_lottery(customers, quantum, verbose=True, tellers=num_tellers)
+            lottery_results = calculate_metrics(customers)
+            results["Lottery"] = lottery_results
+            print(f"Lottery Metrics: {lottery_results}")
+        elif choice == '8':
+            quantum = int(input("Enter the quantum time: "))
+            tellers = simulate_stride(customers, quantum, verbose=True, tellers=num_tellers)
+            stride_results = calculate_metrics(customers)
+            results["Stride"] = stride_results
+            print(f"Stride Metrics: {stride_results}")
         else:
             print("Invalid choice. Please try again.")
             continue
 
+        for teller in tellers:
+            print(f"Teller {teller.id}: served {teller.served}, busy {teller.busy_time}, utilization {teller.utilization:.2%}")
+
         visualize_results(results)
 
         again = input("Do you want to choose another algorithm? (y/n): ")
@@ -1,20 +1,126 @@
+import math
+from array import array
+from collections import namedtuple
+from collections.abc import Mapping
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PERCENTILES = (50, 95, 99)
+COLUMNS = ("arrival_time", "start_time", "end_time", "burst_time")
+
+# The first three fields keep the original (turnaround, waiting, response)
+# averages so results can still be indexed positionally.
+Metrics = namedtuple("Metrics", [
+    "avg_turnaround_time", "avg_waiting_time", "avg_response_time",
+    "p50_turnaround_time", "p95_turnaround_time", "p99_turnaround_time", "max_turnaround_time",
+    "p50_waiting_time", "p95_waiting_time", "p99_waiting_time", "max_waiting_time",
+    "p50_response_time", "p95_response_time", "p99_response_time", "max_response_time",
+    "throughput", "fairness",
+])
+
 def calculate_metrics(customers):
-    total_turnaround_time = 0
-    total_waiting_time = 0
-    total_response_time = 0
+    # Accepts Customer objects (or any iterator of completions), a mapping of
+    # columns, or a columnar table exposing arrival_time/start_time/end_time/
+    # burst_time arrays. Columns are processed vectorized when NumPy is present.
+    columns = _columns(customers)
+    if columns is None:
+        completions = ((customer.arrival_time, customer.start_time, customer.end_time, getattr(customer, "burst_time", None)) for customer in customers)
+        return _streaming_metrics(completions)
+    if np is not None:
+        return _vectorized_metrics(*columns)
+    return _streaming_metrics(zip(*columns))
+
+def _columns(customers):
+    if isinstance(customers, Mapping):
+        source = customers.get
+    elif all(hasattr(customers, column) for column in COLUMNS[:3]):
+        source = lambda column: getattr(customers, column, None)
+    else:
+        return None
+    columns = [source(column) for column in COLUMNS]
+    if columns[3] is None:
+        # Without bursts, waiting time falls back to time before first service.
+        columns[3] = [None] * len(columns[0])
+    return columns
+
+def _rank(n, percentile):
+    # Nearest-rank percentile index into a sorted sample of size n.
+    return max(0, math.ceil(percentile * n / 100) - 1)
+
+def _streaming_metrics(completions):
+    turnaround_times = array('d')
+    waiting_times = array('d')
+    response_times = array('d')
+    slowdown_sum = slowdown_squares = 0.0
+    first_arrival = last_end = None
+
+    for arrival_time, start_time, end_time, burst_time in completions:
+        turnaround_time = end_time - arrival_time
+        response_time = start_time - arrival_time
+        if burst_time is None:
+            waiting_time = response_time
+            slowdown = turnaround_time
+        else:
+            waiting_time = turnaround_time - burst_time
+            slowdown = turnaround_time / burst_time if burst_time > 0 else turnaround_time
+        turnaround_times.append(turnaround_time)
+        waiting_times.append(waiting_time)
+        response_times.append(response_time)
+        slowdown_sum += slowdown
+        slowdown_squares += slowdown * slowdown
+        if first_arrival is None or arrival_time < first_arrival:
+            first_arrival = arrival_time
+        if last_end is None or end_time > last_end:
+            last_end = end_time
+
+    n = len(turnaround_times)
+    if n == 0:
+        raise ValueError("No completed customers to measure.")
+
+    fields = [sum(turnaround_times) / n, sum(waiting_times) / n, sum(response_times) / n]
+    for values in (turnaround_times, waiting_times, response_times):
+        ordered = sorted(values)
+        fields.extend(ordered[_rank(n, p)] for p in PERCENTILES)
+        fields.append(ordered[-1])
+    fields.append(_throughput(n, first_arrival, last_end))
+    fields.append(_fairness(n, slowdown_sum, slowdown_squares))
+    return Metrics(*fields)
+
+def _vectorized_metrics(arrival_time, start_time, end_time, burst_time):
+    arrival_time = np.asarray(arrival_time, dtype=float)
+    start_time = np.asarray(start_time, dtype=float)
+    end_time = np.asarray(end_time, dtype=float)
+    n = len(arrival_time)
+    if n == 0:
+        raise ValueError("No completed customers to measure.")
 
-    for customer in customers:
-        turnaround_time = customer.end_time - customer.arrival_time
-        waiting_time = turnaround_time - (customer.end_time - customer.start_time)
-        response_time = customer.start_time - customer.arrival_time
+    turnaround_times = end_time - arrival_time
+    response_times = start_time - arrival_time
+    if burst_time[0] is None:
+        waiting_times = response_times
+        slowdowns = turnaround_times
+    else:
+        burst_time = np.asarray(burst_time, dtype=float)
+        waiting_times = turnaround_times - burst_time
+        slowdowns = np.divide(turnaround_times, burst_time, out=turnaround_times.copy(), where=burst_time > 0)
 
-        total_turnaround_time += turnaround_time
-        total_waiting_time += waiting_time
-        total_response_time += response_time
+    fields = [turnaround_times.mean(), waiting_times.mean(), response_times.mean()]
+    ranks = [_rank(n, p) for p in PERCENTILES]
+    for values in (turnaround_times, waiting_times, response_times):
+        fields.extend(np.partition(values, ranks)[ranks].tolist())
+        fields.append(values.max())
+    fields.append(_throughput(n, arrival_time.min(), end_time.max()))
+    fields.append(_fairness(n, slowdowns.sum(), np.dot(slowdowns, slowdowns)))
+    return Metrics(*(float(field) for field in fields))
 
-    n = len(customers)
-    avg_turnaround_time = total_turnaround_time / n
-    avg_waiting_time = total_waiting_time / n
-    avg_response_time = total_response_time / n
+def _throughput(n, first_arrival, last_end):
+    span = last_end - first_arrival
+    return n / span if span > 0 else float('inf')
 
-    return avg_turnaround_time, avg_waiting_time, avg_response_time
+def _fairness(n, total, squares):
+    # Jain's index over per-customer slowdown: 1.0 when every customer is
+    # slowed down equally, 1/n when one customer absorbs all the delay.
+    return total * total / (n * squares) if squares > 0 else 1.0
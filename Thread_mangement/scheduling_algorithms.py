@@ -1,48 +1,367 @@
+import heapq
+import itertools
 import random
-import time
-
-def simulate_fcfs(customers):
-    for customer in customers:
-        service_time = random.randint(1, 5)
-        if customer.start_time is None:
-            customer.start_time = time.time()
-        time.sleep(service_time)
-        customer.end_time = time.time()
-        print(f"Customer {customer.id} serviced for {service_time} seconds")
-
-def simulate_sjf(customers):
-    customers = sorted(customers, key=lambda x: random.randint(1, 5))
-    for customer in customers:
-        service_time = random.randint(1, 5)
-        if customer.start_time is None:
-            customer.start_time = time.time()
-        time.sleep(service_time)
-        customer.end_time = time.time()
-        print(f"Customer {customer.id} serviced for {service_time} seconds")
-
-def simulate_srtf(customers):
-    remaining_customers = customers[:]
-    while remaining_customers:
-        remaining_customers.sort(key=lambda x: random.randint(1, 5))
-        current_customer = remaining_customers.pop(0)
-        service_time = random.randint(1, 5)
-        if current_customer.start_time is None:
-            current_customer.start_time = time.time()
-        time.sleep(service_time)
-        current_customer.end_time = time.time()
-        print(f"Customer {current_customer.id} serviced for {service_time} seconds")
-
-def simulate_rr(customers, quantum):
-    queue = customers[:]
-    while queue:
-        current_customer = queue.pop(0)
-        if current_customer.start_time is None:
-            current_customer.start_time = time.time()
-        service_time = min(quantum, random.randint(1, 5))
-        time.sleep(service_time)
-        if service_time < quantum:
-            current_customer.end_time = time.time()
-            print(f"Customer {current_customer.id} finished with service time {service_time} seconds")
+from collections import deque
+from customer import CustomerTable
+from teller import Teller
+
+# Event kinds; at equal timestamps departures sort ahead of arrivals so the
+# server is released before new customers join the ready queue.
+DEPARTURE = 0
+ARRIVAL = 1
+
+
+class EventQueue:
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+
+    def push(self, time, kind, customer, teller=None, token=None):
+        heapq.heappush(self._heap, (time, kind, next(self._counter), customer, teller, token))
+
+    def pop(self):
+        time, kind, _, customer, teller, token = heapq.heappop(self._heap)
+        return time, kind, customer, teller, token
+
+    def peek_time(self):
+        return self._heap[0][0]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+def run_simulation(customers, scheduler, verbose=False, context_switch=0, tellers=1):
+    # Discrete-event loop on a virtual clock: nothing sleeps, the clock jumps
+    # straight to the next arrival or departure in the event list. Arrivals
+    # are fed in one at a time so the heap never holds more than one event
+    # per teller plus the next arrival.
+    if isinstance(tellers, int):
+        tellers = [Teller(i, None) for i in range(tellers)]
+    if isinstance(customers, CustomerTable):
+        arrivals = customers.arrival_order()
+    else:
+        arrivals = iter(sorted(customers, key=lambda x: x.arrival_time))
+    events = EventQueue()
+    customer = next(arrivals, None)
+    if customer is not None:
+        events.push(customer.arrival_time, ARRIVAL, customer)
+
+    opened = clock = None
+    token = 0
+    while events:
+        clock, kind, customer, teller, event_token = events.pop()
+        scheduler.clock = clock
+        if opened is None:
+            opened = clock
+        if kind == ARRIVAL:
+            following = next(arrivals, None)
+            if following is not None:
+                events.push(following.arrival_time, ARRIVAL, following)
+            busy = [t for t in tellers if t.running is not None]
+            if len(busy) == len(tellers):
+                # Only the teller holding the longest remaining job is a
+                # preemption candidate.
+                teller = max(busy, key=lambda t: t.running.remaining_time - max(0, clock - t.dispatched_at))
+                elapsed = max(0, clock - teller.dispatched_at)
+                if scheduler.preempts(customer, teller.running, teller.running.remaining_time - elapsed):
+                    running = teller.running
+                    running.remaining_time -= elapsed
+                    teller.busy_time += clock - teller.switched_at
+                    scheduler.add(running)
+                    if verbose:
+                        print(f"Customer {running.id} preempted by Customer {customer.id} at Teller {teller.id}; remaining time {running.remaining_time}")
+                    # Clearing the token orphans the preempted customer's departure.
+                    teller.running = teller.token = None
+            scheduler.add(customer)
+        elif event_token == teller.token:
+            teller.running = teller.token = None
+            teller.busy_time += clock - teller.switched_at
+            customer.remaining_time -= teller.run_time
+            if customer.remaining_time <= 0:
+                customer.end_time = clock
+                teller.served += 1
+                scheduler.complete(customer)
+                if verbose:
+                    print(f"Customer {customer.id} serviced for {customer.burst_time} seconds in {customer.slices} slice(s) at Teller {teller.id}")
+            else:
+                scheduler.add(customer)
+                if verbose:
+                    print(f"Customer {customer.id} quantum expired at Teller {teller.id}; remaining time {customer.remaining_time}")
+
+        # Only dispatch once every event at this instant has been applied.
+        if not events or events.peek_time() > clock:
+            for teller in tellers:
+                if not len(scheduler):
+                    break
+                if teller.running is not None:
+                    continue
+                running, run_time = scheduler.select()
+                teller.switched_at = teller.dispatched_at = clock
+                if teller.last is not None and running is not teller.last:
+                    teller.dispatched_at += context_switch
+                teller.running, teller.last, teller.run_time = running, running, run_time
+                if running.start_time is None:
+                    running.start_time = teller.dispatched_at
+                running.slices += 1
+                token += 1
+                teller.token = token
+                events.push(teller.dispatched_at + run_time, DEPARTURE, running, teller, token)
+
+    for teller in tellers:
+        teller.utilization = teller.busy_time / (clock - opened) if clock is not None and clock > opened else 0
+    return tellers
+
+
+class FCFSScheduler:
+    clock = 0
+
+    def __init__(self):
+        self.ready = deque()
+
+    def add(self, customer):
+        self.ready.append(customer)
+
+    def select(self):
+        customer = self.ready.popleft()
+        return customer, customer.remaining_time
+
+    def preempts(self, customer, running, remaining_time):
+        return False
+
+    def complete(self, customer):
+        pass
+
+    def __len__(self):
+        return len(self.ready)
+
+
+class SJFScheduler(FCFSScheduler):
+    # Min-heap keyed by remaining time; the counter keeps ties in FIFO order.
+    def __init__(self):
+        self.ready = []
+        self._counter = itertools.count()
+
+    def add(self, customer):
+        heapq.heappush(self.ready, (customer.remaining_time, next(self._counter), customer))
+
+    def select(self):
+        customer = heapq.heappop(self.ready)[-1]
+        return customer, customer.remaining_time
+
+
+class SRTFScheduler(SJFScheduler):
+    def preempts(self, customer, running, remaining_time):
+        return customer.remaining_time < remaining_time
+
+
+class RRScheduler(FCFSScheduler):
+    def __init__(self, quantum):
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive.")
+        super().__init__()
+        self.quantum = quantum
+
+    def select(self):
+        customer = self.ready.popleft()
+        return customer, min(self.quantum, customer.remaining_time)
+
+
+
+class PriorityScheduler(SJFScheduler):
+    # Aging lifts a waiting customer by `aging` priority levels per time unit.
+    # Every queued customer ages at the same rate, so ordering by
+    # priority + aging * enqueue_time is equivalent and never needs re-keying.
+    def __init__(self, aging=0, preemptive=False):
+        super().__init__()
+        self.aging = aging
+        self.preemptive = preemptive
+
+    def add(self, customer):
+        heapq.heappush(self.ready, (customer.priority + self.aging * self.clock, next(self._counter), customer))
+
+    def preempts(self, customer, running, remaining_time):
+        return self.preemptive and customer.priority < running.priority
+
+
+class MLFQScheduler(FCFSScheduler):
+    # One deque per level. A customer that uses its whole quantum drops a
+    # level; one that is preempted keeps it. Periodic boosts lift everyone
+    # back to the top level so long batch jobs cannot starve.
+    def __init__(self, quanta=(1, 2, 4), boost_interval=None):
+        if not quanta or min(quanta) <= 0:
+            raise ValueError("MLFQ needs at least one level and positive quanta.")
+        self.quanta = quanta
+        self.levels = [deque() for _ in quanta]
+        self.boost_interval = boost_interval
+        self.last_boost = None
+        self.level = {}
+        self.expected = {}
+        self.count = 0
+
+    def add(self, customer):
+        level = self.level.get(customer, 0)
+        if self.expected.pop(customer, None) == customer.remaining_time and level < len(self.levels) - 1:
+            level += 1
+        self.level[customer] = level
+        self.levels[level].append(customer)
+        self.count += 1
+
+    def select(self):
+        self._boost()
+        level = next(i for i, queue in enumerate(self.levels) if queue)
+        customer = self.levels[level].popleft()
+        self.count -= 1
+        run_time = min(self.quanta[level], customer.remaining_time)
+        # Re-added with exactly this remaining time means the slice ran out.
+        self.expected[customer] = customer.remaining_time - run_time
+        return customer, run_time
+
+    def _boost(self):
+        if self.boost_interval is None:
+            return
+        if self.last_boost is None:
+            self.last_boost = self.clock
+        elif self.clock - self.last_boost >= self.boost_interval:
+            self.last_boost = self.clock
+            top = self.levels[0]
+            for queue in self.levels[1:]:
+                top.extend(queue)
+                queue.clear()
+            for customer in self.level:
+                self.level[customer] = 0
+
+    def preempts(self, customer, running, remaining_time):
+        return self.level.get(customer, 0) < self.level[running]
+
+    def complete(self, customer):
+        self.level.pop(customer, None)
+        self.expected.pop(customer, None)
+
+    def __len__(self):
+        return self.count
+
+
+def _tickets(customer):
+    # Ticket share falls off with priority number: priority 0 gets 100.
+    return max(1, 100 // (customer.priority + 1))
+
+
+class LotteryScheduler(FCFSScheduler):
+    # Ready customers occupy slots of a Fenwick tree of ticket counts, so
+    # joining the queue and drawing a winner are both O(log n).
+    def __init__(self, quantum, seed=0):
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive.")
+        self.quantum = quantum
+        self.rng = random.Random(seed)
+        self.slots = []
+        self.weights = []
+        self.free = []
+        self.tree = [0]
+        self.total = 0
+        self.count = 0
+
+    def add(self, customer):
+        tickets = _tickets(customer)
+        if self.free:
+            slot = self.free.pop()
         else:
-            queue.append(current_customer)
-            print(f"Customer {current_customer.id} quantum expired; remaining time {random.randint(1, 5) - quantum}")
+            slot = len(self.slots)
+            self.slots.append(None)
+            self.weights.append(0)
+            if len(self.slots) >= len(self.tree):
+                self._rebuild(2 * len(self.slots))
+        self.slots[slot] = customer
+        self._update(slot, tickets)
+        self.count += 1
+
+    def select(self):
+        draw = self.rng.randrange(self.total)
+        position = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            following = position + step
+            if following < len(self.tree) and self.tree[following] <= draw:
+                position = following
+                draw -= self.tree[following]
+            step >>= 1
+        customer = self.slots[position]
+        self.slots[position] = None
+        self._update(position, -self.weights[position])
+        self.free.append(position)
+        self.count -= 1
+        return customer, min(self.quantum, customer.remaining_time)
+
+    def _update(self, slot, delta):
+        self.weights[slot] += delta
+        self.total += delta
+        i = slot + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def _rebuild(self, capacity):
+        self.tree = [0] * (capacity + 1)
+        for i, weight in enumerate(self.weights, 1):
+            self.tree[i] += weight
+            parent = i + (i & -i)
+            if parent <= capacity:
+                self.tree[parent] += self.tree[i]
+
+    def __len__(self):
+        return self.count
+
+
+STRIDE1 = 1 << 20
+
+class StrideScheduler(FCFSScheduler):
+    # Deterministic lottery: a min-heap on pass values, each customer's pass
+    # advancing by STRIDE1 / tickets per full quantum it runs.
+    def __init__(self, quantum):
+        if quantum <= 0:
+            raise ValueError("Quantum must be positive.")
+        self.quantum = quantum
+        self.ready = []
+        self._counter = itertools.count()
+        self.passes = {}
+        self.global_pass = 0
+
+    def add(self, customer):
+        # Newcomers start at the current global pass instead of zero, so
+        # they cannot monopolise the teller to catch up.
+        pass_value = self.passes.setdefault(customer, self.global_pass)
+        heapq.heappush(self.ready, (pass_value, next(self._counter), customer))
+
+    def select(self):
+        pass_value, _, customer = heapq.heappop(self.ready)
+        self.global_pass = pass_value
+        run_time = min(self.quantum, customer.remaining_time)
+        self.passes[customer] = pass_value + STRIDE1 / _tickets(customer) * run_time / self.quantum
+        return customer, run_time
+
+    def complete(self, customer):
+        self.passes.pop(customer, None)
+
+def simulate_fcfs(customers, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, FCFSScheduler(), verbose, context_switch, tellers)
+
+def simulate_sjf(customers, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, SJFScheduler(), verbose, context_switch, tellers)
+
+def simulate_srtf(customers, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, SRTFScheduler(), verbose, context_switch, tellers)
+
+def simulate_rr(customers, quantum, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, RRScheduler(quantum), verbose, context_switch, tellers)
+
+def simulate_priority(customers, aging=0, preemptive=False, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, PriorityScheduler(aging, preemptive), verbose, context_switch, tellers)
+
+def simulate_mlfq(customers, quanta=(1, 2, 4), boost_interval=None, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, MLFQScheduler(quanta, boost_interval), verbose, context_switch, tellers)
+
+def simulate_lottery(customers, quantum, seed=0, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, LotteryScheduler(quantum, seed), verbose, context_switch, tellers)
+
+def simulate_stride(customers, quantum, verbose=False, context_switch=0, tellers=1):
+    return run_simulation(customers, StrideScheduler(quantum), verbose, context_switch, tellers)
@@ -1,22 +1,107 @@
 import threading
 import time
-import random
+from collections import deque
 
 class Teller(threading.Thread):
-    def __init__(self, id, service_queue):
+    def __init__(self, id, service_queue, time_scale=1.0):
         threading.Thread.__init__(self)
         self.id = id
         self.service_queue = service_queue
+        self.time_scale = time_scale
+        self.busy_time = 0
+        self.served = 0
+        self.utilization = 0
+        # Dispatch state used when the teller is driven by the virtual-clock
+        # engine in scheduling_algorithms instead of running as a thread.
+        self.running = None
+        self.last = None
+        self.run_time = None
+        self.token = None
+        self.switched_at = None
+        self.dispatched_at = None
 
     def run(self):
         while True:
-            customer = self.service_queue.get()
-            if customer is None:
+            item = self.service_queue.get()
+            if item is None:
                 break
+            customer, service_time = item
             print(f"Customer {customer.id} is in Teller {self.id}")
-            customer.start_time = time.time()
-            service_time = random.randint(1, 5)  # random service time between 1 and 5 seconds
-            time.sleep(service_time)
-            customer.end_time = time.time()
-            print(f"Customer {customer.id} leaves Teller {self.id}")
-            self.service_queue.task_done()
+            started = time.time()
+            if customer.start_time is None:
+                customer.start_time = self.service_queue.now()
+            customer.slices += 1
+            time.sleep(service_time * self.time_scale)
+            customer.remaining_time -= service_time
+            self.busy_time += time.time() - started
+            if customer.remaining_time <= 0:
+                customer.end_time = self.service_queue.now()
+                self.served += 1
+                print(f"Customer {customer.id} leaves Teller {self.id}")
+            else:
+                print(f"Customer {customer.id} returns to the queue from Teller {self.id}")
+            self.service_queue.task_done(customer)
+
+class ServiceQueue:
+    # Thread-safe front for a scheduler so several Teller threads can drain
+    # one shared queue under its policy. Tellers sleep through each slice, so
+    # preemptive policies behave like their non-preemptive counterparts here.
+    # Customers are released into the scheduler at their arrival offsets, and
+    # times are read on the customers' own clock: wall-clock seconds divided
+    # by time_scale, counted from the first arrival.
+    def __init__(self, scheduler, customers, time_scale=1.0):
+        self.scheduler = scheduler
+        self.condition = threading.Condition()
+        self.time_scale = time_scale
+        self.arrivals = deque(sorted(customers, key=lambda x: x.arrival_time))
+        self.pending = len(self.arrivals)
+        self.origin = self.arrivals[0].arrival_time if self.arrivals else 0
+        self.opened = time.time()
+
+    def now(self):
+        return self.origin + (time.time() - self.opened) / self.time_scale
+
+    def _release(self):
+        clock = self.scheduler.clock = self.now()
+        while self.arrivals and self.arrivals[0].arrival_time <= clock:
+            self.scheduler.add(self.arrivals.popleft())
+
+    def get(self):
+        with self.condition:
+            while True:
+                self._release()
+                if len(self.scheduler) or not self.pending:
+                    break
+                # Idle until the next arrival or until another teller hands
+                # a customer back.
+                timeout = None
+                if self.arrivals:
+                    timeout = (self.arrivals[0].arrival_time - self.scheduler.clock) * self.time_scale
+                self.condition.wait(timeout)
+            if not self.pending:
+                return None
+            return self.scheduler.select()
+
+    def task_done(self, customer):
+        with self.condition:
+            self.scheduler.clock = self.now()
+            if customer.remaining_time <= 0:
+                self.pending -= 1
+                self.scheduler.complete(customer)
+            else:
+                self.scheduler.add(customer)
+            self.condition.notify_all()
+
+def serve_customers(customers, scheduler, num_tellers, time_scale=1.0):
+    # Wall-clock counterpart of run_simulation. The customers' arrival times
+    # are left alone; start and end times are stamped on the same clock.
+    service_queue = ServiceQueue(scheduler, customers, time_scale)
+    tellers = [Teller(i, service_queue, time_scale) for i in range(num_tellers)]
+    for teller in tellers:
+        teller.start()
+    for teller in tellers:
+        teller.join()
+    elapsed = time.time() - service_queue.opened
+    for teller in tellers:
+        teller.utilization = teller.busy_time / elapsed if elapsed > 0 else 0
+    return tellers
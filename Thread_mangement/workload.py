@@ -0,0 +1,113 @@
+import csv
+import random
+import struct
+import sys
+from array import array
+from customer import Customer
+
+BURST_DISTRIBUTIONS = ("exponential", "bimodal", "heavy_tailed")
+
+# Priority classes: lower numbers are served first, and the lottery and
+# stride schedulers hand out more tickets to them.
+INTERACTIVE = 0
+BATCH = 1
+
+# Binary trace layout: magic, version, job count, then every arrival time
+# followed by every burst time as little-endian doubles and, from version 2,
+# every priority as a little-endian int64. Version 1 traces read back with
+# every job in the interactive class.
+TRACE_MAGIC = b"SCHDTRCE"
+TRACE_VERSION = 2
+TRACE_HEADER = struct.Struct("<8sII")
+
+def generate_workload(n, seed=0, arrival_rate=1.0, burst="exponential", mean_burst=1.0):
+    if burst not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"Unknown burst distribution {burst!r}; expected one of {BURST_DISTRIBUTIONS}")
+    rng = random.Random(seed)
+    arrivals = array('d')
+    bursts = array('d')
+    priorities = array('q')
+
+    clock = 0.0
+    for _ in range(n):
+        # Poisson arrivals: exponential inter-arrival gaps.
+        clock += rng.expovariate(arrival_rate)
+        arrivals.append(clock)
+        if burst == "bimodal":
+            # 90% short interactive jobs and 10% long batch jobs, same overall mean.
+            if rng.random() < 0.9:
+                bursts.append(rng.expovariate(1 / (mean_burst * 0.5)))
+                priorities.append(INTERACTIVE)
+            else:
+                bursts.append(rng.expovariate(1 / (mean_burst * 5.5)))
+                priorities.append(BATCH)
+            continue
+        if burst == "exponential":
+            bursts.append(rng.expovariate(1 / mean_burst))
+        else:
+            # Pareto with alpha 1.5: finite mean, infinite variance.
+            bursts.append(rng.paretovariate(1.5) * mean_burst / 3)
+        # Without an explicit short/long split, jobs longer than the mean are
+        # treated as batch work.
+        priorities.append(BATCH if bursts[-1] > mean_burst else INTERACTIVE)
+    return arrivals, bursts, priorities
+
+def make_customers(arrivals, bursts, priorities=None):
+    if priorities is None:
+        priorities = [INTERACTIVE] * len(arrivals)
+    return [Customer(i, arrival_time, burst_time, priority) for i, (arrival_time, burst_time, priority) in enumerate(zip(arrivals, bursts, priorities))]
+
+def write_trace(path, arrivals, bursts, priorities=None):
+    if priorities is None:
+        priorities = [INTERACTIVE] * len(arrivals)
+    if not len(arrivals) == len(bursts) == len(priorities):
+        raise ValueError("Arrival, burst and priority streams must have the same length.")
+    if str(path).endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "arrival_time", "burst_time", "priority"])
+            writer.writerows((i, repr(arrival_time), repr(burst_time), priority)
+                             for i, (arrival_time, burst_time, priority) in enumerate(zip(arrivals, bursts, priorities)))
+        return
+
+    arrivals, bursts, priorities = array('d', arrivals), array('d', bursts), array('q', priorities)
+    if sys.byteorder == "big":
+        arrivals.byteswap()
+        bursts.byteswap()
+        priorities.byteswap()
+    with open(path, "wb") as f:
+        f.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, len(arrivals)))
+        arrivals.tofile(f)
+        bursts.tofile(f)
+        priorities.tofile(f)
+
+def read_trace(path):
+    arrivals = array('d')
+    bursts = array('d')
+    priorities = array('q')
+    if str(path).endswith(".csv"):
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            next(reader)
+            # Older traces have no priority column.
+            for _, arrival_time, burst_time, *priority in reader:
+                arrivals.append(float(arrival_time))
+                bursts.append(float(burst_time))
+                priorities.append(int(priority[0]) if priority else INTERACTIVE)
+        return arrivals, bursts, priorities
+
+    with open(path, "rb") as f:
+        magic, version, n = TRACE_HEADER.unpack(f.read(TRACE_HEADER.size))
+        if magic != TRACE_MAGIC or not 1 <= version <= TRACE_VERSION:
+            raise ValueError(f"{path} is not a version 1-{TRACE_VERSION} scheduling trace.")
+        arrivals.fromfile(f, n)
+        bursts.fromfile(f, n)
+        if version >= 2:
+            priorities.fromfile(f, n)
+        else:
+            priorities = array('q', [INTERACTIVE]) * n
+    if sys.byteorder == "big":
+        arrivals.byteswap()
+        bursts.byteswap()
+        priorities.byteswap()
+    return arrivals, bursts, priorities
@@ -1,372 +1,1415 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import tkinter.ttk as ttk
+import itertools
+import pickle
+import re
+import struct
+from bisect import bisect_left, bisect_right, insort
+
+SNAPSHOT_MAGIC = b"MMSNAPSH"
+SNAPSHOT_VERSION = 3
+SNAPSHOT_HEADER = struct.Struct("<8sI")
+
+class ChunkedList:
+    # A list (or bytearray) stored as fixed-size chunks so it can be forked
+    # copy-on-write per chunk: a fork shares every chunk, and the first write
+    # to a shared chunk copies just that chunk. Supports indexing, len,
+    # iteration, fill and stack-style append/pop.
+    SHIFT = 12
+    SIZE = 1 << SHIFT
+
+    def __init__(self, items=()):
+        self.length = len(items)
+        self.chunks = [items[i:i + self.SIZE] for i in range(0, self.length, self.SIZE)]
+        self.private = [True] * len(self.chunks)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        return self.chunks[index >> self.SHIFT][index & (self.SIZE - 1)]
+
+    def __setitem__(self, index, value):
+        self.writable(index >> self.SHIFT)[index & (self.SIZE - 1)] = value
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self.chunks)
+
+    def writable(self, k):
+        if not self.private[k]:
+            self.chunks[k] = self.chunks[k][:]
+            self.private[k] = True
+        return self.chunks[k]
+
+    def fill(self, start, end, value):
+        while start < end:
+            k, offset = start >> self.SHIFT, start & (self.SIZE - 1)
+            step = min(end - start, self.SIZE - offset)
+            chunk = self.writable(k)
+            chunk[offset:offset + step] = bytes((value,)) * step if isinstance(chunk, bytearray) else [value] * step
+            start += step
+
+    def append(self, value):
+        if self.length & (self.SIZE - 1) == 0:
+            self.chunks.append([])
+            self.private.append(True)
+        self.writable(len(self.chunks) - 1).append(value)
+        self.length += 1
+
+    def pop(self):
+        k = len(self.chunks) - 1
+        value = self.writable(k).pop()
+        self.length -= 1
+        if not self.chunks[k]:
+            del self.chunks[k], self.private[k]
+        return value
+
+    def __getstate__(self):
+        # Pickled flat; the chunks are cut again, all private, on load.
+        if self.chunks and isinstance(self.chunks[0], bytearray):
+            return (bytearray().join(self.chunks),)
+        return (list(self),)
+
+    def __setstate__(self, state):
+        self.__init__(state[0])
+
+    def fork(self):
+        clone = ChunkedList.__new__(ChunkedList)
+        clone.length = self.length
+        clone.chunks = list(self.chunks)
+        self.private = [False] * len(self.chunks)
+        clone.private = list(self.private)
+        return clone
+
+class MemoryMap:
+    # Ownership of every unit without one Python slot per unit: a bitmap
+    # (bit set = allocated, LSB first) for free-run searches plus an extent
+    # map start -> (end, process_id) for lookups. Indexing returns the owning
+    # process or None, like the list it replaces. Hole sizes (maximal free
+    # runs) are kept sorted and updated on every assign/release, so free size,
+    # hole count and the largest hole can be read without a scan. The bitmap
+    # is a ChunkedList of bytearrays, so forks share it chunk by chunk.
+    _NOT_EMPTY = re.compile(rb'[^\x00]')
+    _NOT_FULL = re.compile(rb'[^\xff]')
+
+    def __init__(self, total_size):
+        self.total_size = total_size
+        self._clear_bits()
+        self.extents = {}
+        self.starts = []
+        self.free_size = total_size
+        self.hole_sizes = [total_size] if total_size > 0 else []
+        self.shared = False
+
+    def _clear_bits(self):
+        self.bits = ChunkedList(bytearray((self.total_size + 7) // 8))
+        # Padding bits past the end are marked used so they never look free.
+        if self.total_size % 8:
+            self.bits[len(self.bits) - 1] = (0xff << (self.total_size % 8)) & 0xff
+
+    def __getstate__(self):
+        # Snapshots keep the extents and hole sizes only; the bitmap and the
+        # sorted starts are rebuilt from the extents on load.
+        return {'total_size': self.total_size, 'extents': self.extents, 'free_size': self.free_size, 'hole_sizes': self.hole_sizes}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.starts = sorted(self.extents)
+        self.shared = False
+        self._clear_bits()
+        for start in self.starts:
+            self._fill(start, self.extents[start][0], True)
+
+    def __len__(self):
+        return self.total_size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.total_size:
+            raise IndexError("memory index out of range")
+        i = bisect_right(self.starts, index) - 1
+        if i >= 0:
+            end, process_id = self.extents[self.starts[i]]
+            if index < end:
+                return process_id
+        return None
+
+    def __iter__(self):
+        for start, end, process_id in self.runs():
+            yield from itertools.repeat(process_id, end - start)
+
+    def runs(self, start=0, end=None):
+        # (start, end, process_id) for every allocated extent and free gap,
+        # with process_id None for the gaps, clipped to [start, end).
+        end = self.total_size if end is None else min(end, self.total_size)
+        position = start
+        i = bisect_right(self.starts, start) - 1
+        if i < 0 or self.extents[self.starts[i]][0] <= start:
+            i += 1
+        for extent_start in itertools.islice(self.starts, i, None):
+            if extent_start >= end:
+                break
+            extent_end, process_id = self.extents[extent_start]
+            if extent_start > position:
+                yield position, extent_start, None
+            position = max(position, extent_start)
+            yield position, min(extent_end, end), process_id
+            position = min(extent_end, end)
+        if position < end:
+            yield position, end, None
+
+    def occupancy(self, start, end, buckets):
+        # Fraction of each of `buckets` equal slices of [start, end) that is
+        # allocated. Extents are disjoint, so this is O(extents + buckets).
+        bounds = [start + (end - start) * k // buckets for k in range(buckets + 1)]
+        used = [0] * buckets
+        for run_start, run_end, process_id in self.runs(start, end):
+            if process_id is None:
+                continue
+            k = bisect_right(bounds, run_start) - 1
+            while run_start < run_end:
+                step = min(run_end, bounds[k + 1]) - run_start
+                used[k] += step
+                run_start += step
+                k += 1
+        return [units / (bounds[k + 1] - bounds[k]) for k, units in enumerate(used)]
+
+    def fork(self):
+        # Copy-on-write: the two maps share their storage until one of them
+        # is written to, and the writer then takes a private copy of the
+        # extent index and of the bitmap chunks it touches.
+        clone = MemoryMap.__new__(MemoryMap)
+        clone.__dict__.update(self.__dict__)
+        clone.bits = self.bits.fork()
+        self.shared = clone.shared = True
+        return clone
+
+    def _unshare(self):
+        if self.shared:
+            self.extents = dict(self.extents)
+            self.starts = list(self.starts)
+            self.hole_sizes = list(self.hole_sizes)
+            self.shared = False
+
+    def largest_hole(self):
+        return self.hole_sizes[-1] if self.hole_sizes else 0
+
+    def assign(self, start, end, process_id):
+        if start >= end:
+            return
+        self._unshare()
+        # The range lies inside one hole, which is split around it.
+        i = bisect_left(self.starts, start)
+        hole_start = self.extents[self.starts[i - 1]][0] if i else 0
+        hole_end = self.starts[i] if i < len(self.starts) else self.total_size
+        self._fill(start, end, True)
+        self.extents[start] = (end, process_id)
+        self.starts.insert(i, start)
+        self.free_size -= end - start
+        self._update_holes((hole_end - hole_start,), (start - hole_start, hole_end - end))
+
+    def release(self, start, end):
+        if start >= end:
+            return
+        self._unshare()
+        # The freed range merges with the holes on either side of it.
+        i = bisect_left(self.starts, start)
+        hole_start = self.extents[self.starts[i - 1]][0] if i else 0
+        hole_end = self.starts[i + 1] if i + 1 < len(self.starts) else self.total_size
+        self._fill(start, end, False)
+        del self.extents[start]
+        del self.starts[i]
+        self.free_size += end - start
+        self._update_holes((start - hole_start, hole_end - end), (hole_end - hole_start,))
+
+    def _update_holes(self, removed, added):
+        for size in removed:
+            if size > 0:
+                del self.hole_sizes[bisect_left(self.hole_sizes, size)]
+        for size in added:
+            if size > 0:
+                insort(self.hole_sizes, size)
+
+    def is_free(self, start, end):
+        return self.next_used(start, end) >= end
+
+    def next_free(self, position, limit=None):
+        return self._scan(position, False, limit)
+
+    def next_used(self, position, limit=None):
+        return self._scan(position, True, limit)
+
+    def find_free_run(self, size, position=0):
+        # A free run of `size` units must contain (size - 14) // 8 whole zero
+        # bytes, so bytearray.find can jump straight to candidate runs; only
+        # the partial byte just before the match needs a bit-level look.
+        need = (size - 14) // 8
+        while position < self.total_size:
+            if need > 0:
+                byte = self._find_zero_bytes(need, position >> 3)
+                if byte < 0:
+                    return None
+                position = max(position, (byte - 1) << 3)
+            start = self.next_free(position)
+            position = self.next_used(start, start + size)
+            if position - start >= size:
+                return start
+        return None
+
+    def _find_zero_bytes(self, need, byte):
+        # First byte at or after `byte` that can start `need` zero bytes,
+        # searched chunk by chunk. A run that may cross into the next chunk
+        # is reported at the earliest byte it could start from.
+        pattern = bytes(need)
+        k, offset = byte >> ChunkedList.SHIFT, byte & (ChunkedList.SIZE - 1)
+        chunks = self.bits.chunks
+        while k < len(chunks):
+            chunk = chunks[k]
+            found = chunk.find(pattern, offset)
+            if found >= 0:
+                return (k << ChunkedList.SHIFT) + found
+            if not chunk[-1] and k + 1 < len(chunks):
+                return (k << ChunkedList.SHIFT) + max(offset, len(chunk) - need + 1)
+            k, offset = k + 1, 0
+        return -1
+
+    def _find_byte(self, pattern, byte, stop):
+        # Regex search for the first matching byte in [byte, stop), chunk by chunk.
+        chunks = self.bits.chunks
+        while byte < stop:
+            k, offset = byte >> ChunkedList.SHIFT, byte & (ChunkedList.SIZE - 1)
+            base = k << ChunkedList.SHIFT
+            match = pattern.search(chunks[k], offset, stop - base)
+            if match is not None:
+                return base + match.start()
+            byte = base + ChunkedList.SIZE
+        return None
+
+    def _scan(self, position, used, limit=None):
+        # First unit at or after position whose bit equals `used`: check the
+        # partial first byte, then let the regex engine skip whole bytes. The
+        # search stops at `limit` (returned when nothing is found before it).
+        limit = self.total_size if limit is None else min(limit, self.total_size)
+        if position >= limit:
+            return limit
+        byte = position >> 3
+        value = self.bits[byte] if used else ~self.bits[byte] & 0xff
+        value &= (0xff << (position & 7)) & 0xff
+        if not value:
+            byte = self._find_byte(self._NOT_EMPTY if used else self._NOT_FULL, byte + 1, (limit + 7) >> 3)
+            if byte is None:
+                return limit
+            value = self.bits[byte] if used else ~self.bits[byte] & 0xff
+        return min(limit, (byte << 3) + (value & -value).bit_length() - 1)
+
+    def _fill(self, start, end, used):
+        first, last = start >> 3, (end - 1) >> 3
+        if first == last:
+            masks = [(first, ((1 << (end - start)) - 1) << (start & 7))]
+        else:
+            masks = [(first, (0xff << (start & 7)) & 0xff), (last, (1 << (((end - 1) & 7) + 1)) - 1)]
+            self.bits.fill(first + 1, last, 0xff if used else 0)
+        for byte, mask in masks:
+            if used:
+                self.bits[byte] |= mask
+            else:
+                self.bits[byte] &= ~mask & 0xff
 
 class MemoryManagement:
     def __init__(self, total_size):
         self.total_size = total_size
-        self.memory = [None] * total_size
+        self.memory = MemoryMap(total_size)
         self.processes = {}
         self.allocation_attempts = 0
         self.successful_allocations = 0
         self.algorithm_efficiency = {}
+        self.last_error = None
+        # Units reserved for a process but not requested by it (partition,
+        # block or page slack). Subclasses update it on allocate/deallocate.
+        self.internal_waste = 0
+
+    def _fail(self, message):
+        # Allocators stay headless: failures are reported as a False result
+        # with the reason in last_error, and the GUI decides how to show it.
+        self.last_error = message
+        return False
 
-    def display_memory(self):
-        memory_status = "Memory Allocation:\n"
-        for i in range(self.total_size):
-            if self.memory[i] is None:
-                memory_status += f"[{i}]: Free\n"
+    def snapshot(self):
+        # The whole allocator state as one compact byte string.
+        return pickle.dumps(self, pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, snapshot):
+        state = pickle.loads(snapshot)
+        if type(state) is not type(self):
+            raise ValueError(f"Cannot restore a {type(state).__name__} snapshot into {type(self).__name__}.")
+        self.__dict__.clear()
+        self.__dict__.update(state.__dict__)
+
+    # Attributes fixed at construction, shared rather than copied by fork().
+    READ_ONLY = ()
+
+    def fork(self):
+        # An independent allocator continuing from the current state. The
+        # structures that grow with the address space (memory maps and free
+        # indexes) fork themselves copy-on-write, read-only tables are
+        # shared, and the per-allocation bookkeeping is copied.
+        clone = object.__new__(type(self))
+        state = {}
+        for name, value in vars(self).items():
+            if name in self.READ_ONLY:
+                clone.__dict__[name] = value
+            elif hasattr(value, 'fork'):
+                clone.__dict__[name] = value.fork()
             else:
-                memory_status += f"[{i}]: Process {self.memory[i]}\n"
-        return memory_status
+                state[name] = value
+        clone.__dict__.update(pickle.loads(pickle.dumps(state, pickle.HIGHEST_PROTOCOL)))
+        return clone
 
-    def visualize_memory(self):
-        data = ['Free' if x is None else f'P{x}' for x in self.memory]
+    def display_memory(self):
+        # One line per run of units with the same owner.
+        lines = ["Memory Allocation:"]
+        for start, end, process_id in self.memory.runs():
+            units = f"[{start}]" if end - start == 1 else f"[{start}-{end - 1}]"
+            lines.append(f"{units}: Free" if process_id is None else f"{units}: Process {process_id}")
+        return "\n".join(lines) + "\n"
+
+    def visualize_memory(self, start=0, end=None, max_extents=2000, resolution=1000):
+        # One rectangle per allocated or free run of [start, end). When the
+        # view holds more than max_extents runs it is drawn instead as an
+        # occupancy strip of at most `resolution` buckets (blue free, red used).
+        import matplotlib.pyplot as plt
+        end = self.total_size if end is None else min(end, self.total_size)
         fig, ax = plt.subplots(figsize=(10, 2))
-        ax.bar(range(self.total_size), [1] * self.total_size, color=['blue' if x == 'Free' else 'red' for x in data])
+        runs = list(itertools.islice(self.memory.runs(start, end), max_extents + 1))
+        if len(runs) <= max_extents:
+            ax.broken_barh([(s, e - s) for s, e, process_id in runs if process_id is None], (0, 1), facecolors='blue')
+            ax.broken_barh([(s, e - s) for s, e, process_id in runs if process_id is not None], (0, 1),
+                           facecolors='red', edgecolors='black', linewidth=0.5)
+            # Only label extents wide enough to read.
+            for s, e, process_id in runs:
+                if process_id is not None and (e - s) * 40 >= end - start:
+                    ax.text((s + e) / 2, 0.5, f'P{process_id}', ha='center', va='center', fontsize=7, color='white')
+        else:
+            buckets = min(resolution, end - start)
+            ax.imshow([self.memory.occupancy(start, end, buckets)], aspect='auto', cmap='coolwarm', vmin=0, vmax=1,
+                      extent=(start, end, 0, 1), interpolation='nearest')
+            ax.set_title(f"Occupancy per {(end - start) / buckets:.0f} units", fontsize=9)
+        ax.set_xlim(start, end)
+        ax.set_ylim(0, 1)
         ax.set_yticks([])
         ax.grid(False)
         ax.spines['top'].set_visible(False)
-        for i, txt in enumerate(range(self.total_size)):
-            ax.text(i, 0, str(txt), ha='center', va='bottom', fontsize=7, color='black')
         return fig
 
     def calculate_fragmentation(self):
-        free_blocks = 0
-        free_size = 0
-        for i in range(self.total_size):
-            if self.memory[i] is None:
-                free_blocks += 1
-                if free_blocks > 1:
-                    free_size += 1
-                else:
-                    free_size = 1
-            else:
-                free_blocks = 0
-
-        fragmentation = 0
-        if self.total_size > 0:
-            fragmentation = (free_size / self.total_size) * 100
-
-        return fragmentation
+        # External fragmentation index as a percentage: 0 when all free
+        # memory is one usable hole, so an empty memory is not fragmented.
+        return self.fragmentation_stats()['external_fragmentation']
+
+    def free_space(self):
+        # (total free, largest hole, hole count) of memory that can still be
+        # handed out. Techniques that place requests exactly read it off the
+        # memory map; the others override it with their own free structures,
+        # since slack left inside a partition, block or slot is internal
+        # fragmentation rather than a hole.
+        return self.memory.free_size, self.memory.largest_hole(), len(self.memory.hole_sizes)
+
+    def external_fragmentation(self, free_size, largest_hole):
+        # 1 - largest hole / total free, as a percentage: 0 when all free
+        # memory is one hole. Techniques whose requests cannot use one big
+        # hole anyway override it.
+        return (1 - largest_hole / free_size) * 100 if free_size else 0.0
+
+    def fragmentation_stats(self):
+        # Read from counters kept up to date by the allocators, never a scan.
+        free_size, largest_hole, hole_count = self.free_space()
+        return {
+            'total_free': free_size,
+            'largest_hole': largest_hole,
+            'hole_count': hole_count,
+            'external_fragmentation': self.external_fragmentation(free_size, largest_hole),
+            'internal_fragmentation': self.internal_waste,
+        }
+
+def save_snapshot(mm, path):
+    with open(path, "wb") as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+        f.write(mm.snapshot())
+
+def load_snapshot(path):
+    # Snapshots are pickles: only load files this simulator wrote.
+    with open(path, "rb") as f:
+        magic, version = SNAPSHOT_HEADER.unpack(f.read(SNAPSHOT_HEADER.size))
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} memory snapshot.")
+        return pickle.loads(f.read())
+
+class MaxTree:
+    # Max segment tree over a fixed list of values, stored in a ChunkedList.
+    # search() finds the leftmost index at or after a position whose value is
+    # at least a size in O(log n).
+    def __init__(self, values):
+        self.leaves = 1 << max(0, len(values) - 1).bit_length()
+        tree = [-1] * (2 * self.leaves)
+        tree[self.leaves:self.leaves + len(values)] = values
+        for node in range(self.leaves - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.tree = ChunkedList(tree)
+
+    def max(self):
+        return self.tree[1]
+
+    def set(self, index, value):
+        tree = self.tree
+        node = self.leaves + index
+        tree[node] = value
+        node //= 2
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+    def search(self, position, size):
+        return self._search(1, 0, self.leaves, position, size)
+
+    def _search(self, node, low, high, position, size):
+        if high <= position or self.tree[node] < size:
+            return None
+        if high - low == 1:
+            return low
+        middle = (low + high) // 2
+        index = self._search(2 * node, low, middle, position, size)
+        if index is None:
+            index = self._search(2 * node + 1, middle, high, position, size)
+        return index
+
+    def __getstate__(self):
+        # Only the leaves are pickled; the inner nodes are rebuilt on load.
+        return (list(itertools.islice(self.tree, self.leaves, None)),)
+
+    def __setstate__(self, state):
+        self.__init__(state[0])
+
+    def fork(self):
+        clone = MaxTree.__new__(MaxTree)
+        clone.leaves = self.leaves
+        clone.tree = self.tree.fork()
+        return clone
+
+class FreePartitions:
+    # Free partitions of a fixed or unequal partitioning, indexed two ways,
+    # each a MaxTree holding a partition's size while it is free and -1 once
+    # taken. by_index, over partition index, answers "leftmost free partition
+    # at or after i that is big enough" for first/next fit; by_rank, over the
+    # partitions in (size, index) order, answers best/worst fit the same way.
+    # Both are O(log P) per query and update, and fork copy-on-write.
+    def __init__(self, sizes):
+        self.sizes = list(sizes)
+        self.largest = max(self.sizes, default=0)
+        self.by_index = MaxTree(self.sizes)
+        self.order = sorted(range(len(self.sizes)), key=self.sizes.__getitem__)
+        self.ranked_sizes = [self.sizes[i] for i in self.order]
+        self.rank = [0] * len(self.sizes)
+        for rank, i in enumerate(self.order):
+            self.rank[i] = rank
+        self.by_rank = MaxTree(self.ranked_sizes)
+        self.count = len(self.sizes)
+        self.free_size = sum(self.sizes)
+
+    def __len__(self):
+        return self.count
+
+    def largest_free(self):
+        return max(self.by_index.max(), 0)
+
+    def take(self, index):
+        self.by_index.set(index, -1)
+        self.by_rank.set(self.rank[index], -1)
+        self.free_size -= self.sizes[index]
+        self.count -= 1
+
+    def release(self, index):
+        self.by_index.set(index, self.sizes[index])
+        self.by_rank.set(self.rank[index], self.sizes[index])
+        self.free_size += self.sizes[index]
+        self.count += 1
+
+    def first_fit(self, size, position=0):
+        return self.by_index.search(position, size)
+
+    def next_fit(self, size, rover):
+        index = self.first_fit(size, rover)
+        return self.first_fit(size) if index is None else index
+
+    def best_fit(self, size):
+        rank = self.by_rank.search(bisect_left(self.ranked_sizes, size), size)
+        return None if rank is None else self.order[rank]
+
+    def worst_fit(self, size):
+        largest = self.by_rank.max()
+        if largest < 0 or largest < size:
+            return None
+        # Lowest index among the largest free partitions.
+        return self.order[self.by_rank.search(bisect_left(self.ranked_sizes, largest), largest)]
+
+    def fork(self):
+        # The size tables never change, so only the trees are forked.
+        clone = FreePartitions.__new__(FreePartitions)
+        clone.__dict__.update(self.__dict__)
+        clone.by_index = self.by_index.fork()
+        clone.by_rank = self.by_rank.fork()
+        return clone
 
 class FixedSizePartitioning(MemoryManagement):
     def __init__(self, total_size, partition_size):
         super().__init__(total_size)
         self.partition_size = partition_size
-        self.partitions = [None] * (total_size // partition_size)
+        self.partitions = ChunkedList([None] * (total_size // partition_size))
+        self.free_partitions = FreePartitions([partition_size] * len(self.partitions))
+        # next_fit resumes its search here instead of at partition 0.
+        self.next_index = 0
 
     def allocate(self, process_id, size, strategy='first_fit'):
         if size > self.partition_size:
-            messagebox.showerror("Error", f"Process {process_id} requires more memory than partition size.")
-            return False
+            return self._fail(f"Process {process_id} requires more memory than partition size.")
 
-        if strategy == 'first_fit':
-            for i in range(len(self.partitions)):
-                if self.partitions[i] is None:
-                    self.partitions[i] = process_id
-                    start = i * self.partition_size
-                    end = start + size
-                    for j in range(start, end):
-                        self.memory[j] = process_id
-                    if process_id in self.processes:
-                        self.processes[process_id].append((start, end))
-                    else:
-                        self.processes[process_id] = [(start, end)]
-                    return True
-        elif strategy == 'best_fit':
-            best_fit_index = -1
-            best_fit_size = float('inf')
-            for i in range(len(self.partitions)):
-                if self.partitions[i] is None:
-                    if self.partition_size - size < best_fit_size:
-                        best_fit_size = self.partition_size - size
-                        best_fit_index = i
-            if best_fit_index != -1:
-                self.partitions[best_fit_index] = process_id
-                start = best_fit_index * self.partition_size
-                end = start + size
-                for j in range(start, end):
-                    self.memory[j] = process_id
-                if process_id in self.processes:
-                    self.processes[process_id].append((start, end))
-                else:
-                    self.processes[process_id] = [(start, end)]
-                return True
+        index = None
+        if strategy in ('first_fit', 'best_fit', 'worst_fit'):
+            # Every partition has the same size, so the first free one is
+            # also the best and the worst fit.
+            index = self.free_partitions.first_fit(size)
         elif strategy == 'next_fit':
-            last_index = 0
-            for i in range(last_index, len(self.partitions)):
-                if self.partitions[i] is None:
-                    self.partitions[i] = process_id
-                    start = i * self.partition_size
-                    end = start + size
-                    for j in range(start, end):
-                        self.memory[j] = process_id
-                    if process_id in self.processes:
-                        self.processes[process_id].append((start, end))
-                    else:
-                        self.processes[process_id] = [(start, end)]
-                    last_index = i
-                    return True
-            for i in range(0, last_index):
-                if self.partitions[i] is None:
-                    self.partitions[i] = process_id
-                    start = i * self.partition_size
-                    end = start + size
-                    for j in range(start, end):
-                        self.memory[j] = process_id
-                    if process_id in self.processes:
-                        self.processes[process_id].append((start, end))
-                    else:
-                        self.processes[process_id] = [(start, end)]
-                    last_index = i
-                    return True
-
-        messagebox.showerror("Error", f"Failed to allocate memory for Process {process_id}")
-        return False
+            index = self.free_partitions.next_fit(size, self.next_index)
+
+        if index is None:
+            return self._fail(f"Failed to allocate memory for Process {process_id}")
+
+        self.next_index = (index + 1) % len(self.partitions)
+        self.partitions[index] = process_id
+        self.free_partitions.take(index)
+        start = index * self.partition_size
+        end = start + size
+        self.memory.assign(start, end, process_id)
+        self.internal_waste += self.partition_size - size
+        if process_id in self.processes:
+            self.processes[process_id].append((start, end))
+        else:
+            self.processes[process_id] = [(start, end)]
+        return True
+
+    def free_space(self):
+        # Only whole free partitions can take a request.
+        return self.free_partitions.free_size, self.free_partitions.largest_free(), len(self.free_partitions)
+
+    def external_fragmentation(self, free_size, largest_hole):
+        # Any free partition takes any request that fits a partition at all.
+        return 0.0
 
     def deallocate(self, process_id):
         if process_id in self.processes:
             allocations = self.processes.pop(process_id)
             for start, end in allocations:
-                for j in range(start, end):
-                    self.memory[j] = None
+                self.memory.release(start, end)
+                self.internal_waste -= self.partition_size - (end - start)
                 partition_index = start // self.partition_size
                 self.partitions[partition_index] = None
-        else:
-            messagebox.showerror("Error", f"Process {process_id} not found in memory.")
+                self.free_partitions.release(partition_index)
+            return True
+        return self._fail(f"Process {process_id} not found in memory.")
 
 class UnequalSizePartitioning(MemoryManagement):
+    READ_ONLY = ('partition_sizes', 'partition_offsets', 'partition_index')
+
     def __init__(self, total_size, partition_sizes):
         super().__init__(total_size)
-        self.partition_sizes = partition_sizes
-        self.partitions = [None] * len(partition_sizes)
+        self.partition_sizes = list(partition_sizes)
+        self.partitions = ChunkedList([None] * len(partition_sizes))
         self.partition_offsets = []
         offset = 0
         for size in partition_sizes:
             self.partition_offsets.append(offset)
             offset += size
+        self.partition_index = {offset: i for i, offset in enumerate(self.partition_offsets)}
+        self.free_partitions = FreePartitions(partition_sizes)
+        self.next_index = 0
 
     def allocate(self, process_id, size, strategy='first_fit'):
-        if size > max(self.partition_sizes):
-            messagebox.showerror("Error", f"Process {process_id} requires more memory than any partition size.")
-            return False
+        if size > self.free_partitions.largest:
+            return self._fail(f"Process {process_id} requires more memory than any partition size.")
 
+        index = None
         if strategy == 'first_fit':
-            for i in range(len(self.partition_sizes)):
-                if self.partitions[i] is None and size <= self.partition_sizes[i]:
-                    self.partitions[i] = process_id
-                    start = self.partition_offsets[i]
-                    end = start + size
-                    for j in range(start, end):
-                        self.memory[j] = process_id
-                    if process_id in self.processes:
-                        self.processes[process_id].append((start, end))
-                    else:
-                        self.processes[process_id] = [(start, end)]
-                    return True
+            index = self.free_partitions.first_fit(size)
         elif strategy == 'best_fit':
-            best_fit_index = -1
-            best_fit_size = float('inf')
-            for i in range(len(self.partition_sizes)):
-                if self.partitions[i] is None and self.partition_sizes[i] >= size:
-                    if self.partition_sizes[i] - size < best_fit_size:
-                        best_fit_size = self.partition_sizes[i] - size
-                        best_fit_index = i
-            if best_fit_index != -1:
-                self.partitions[best_fit_index] = process_id
-                start = self.partition_offsets[best_fit_index]
-                end = start + size
-                for j in range(start, end):
-                    self.memory[j] = process_id
-                if process_id in self.processes:
-                    self.processes[process_id].append((start, end))
-                else:
-                    self.processes[process_id] = [(start, end)]
-                return True
+            index = self.free_partitions.best_fit(size)
+        elif strategy == 'worst_fit':
+            index = self.free_partitions.worst_fit(size)
         elif strategy == 'next_fit':
-            last_index = 0
-            for i in range(last_index, len(self.partition_sizes)):
-                if self.partitions[i] is None and size <= self.partition_sizes[i]:
-                    self.partitions[i] = process_id
-                    start = self.partition_offsets[i]
-                    end = start + size
-                    for j in range(start, end):
-                        self.memory[j] = process_id
-                    if process_id in self.processes:
-                        self.processes[process_id].append((start, end))
-                    else:
-                        self.processes[process_id] = [(start, end)]
-                    last_index = i
-                    return True
-            for i in range(0, last_index):
-                if self.partitions[i] is None and size <= self.partition_sizes[i]:
-                    self.partitions[i] = process_id
-                    start = self.partition_offsets[i]
-                    end = start + size
-                    for j in range(start, end):
-                        self.memory[j] = process_id
-                    if process_id in self.processes:
-                        self.processes[process_id].append((start, end))
-                    else:
-                        self.processes[process_id] = [(start, end)]
-                    last_index = i
-                    return True
-
-        messagebox.showerror("Error", f"Failed to allocate memory for Process {process_id}")
-        return False
+            index = self.free_partitions.next_fit(size, self.next_index)
+
+        if index is None:
+            return self._fail(f"Failed to allocate memory for Process {process_id}")
+
+        self.next_index = (index + 1) % len(self.partitions)
+        self.partitions[index] = process_id
+        self.free_partitions.take(index)
+        start = self.partition_offsets[index]
+        end = start + size
+        self.memory.assign(start, end, process_id)
+        self.internal_waste += self.partition_sizes[index] - size
+        if process_id in self.processes:
+            self.processes[process_id].append((start, end))
+        else:
+            self.processes[process_id] = [(start, end)]
+        return True
+
+    def free_space(self):
+        # Only whole free partitions can take a request.
+        return self.free_partitions.free_size, self.free_partitions.largest_free(), len(self.free_partitions)
+
+    def external_fragmentation(self, free_size, largest_hole):
+        # A request can get at most the largest partition, so measure the
+        # largest free partition against that rather than against the total.
+        return (1 - largest_hole / self.free_partitions.largest) * 100 if free_size else 0.0
 
     def deallocate(self, process_id):
         if process_id in self.processes:
             allocations = self.processes.pop(process_id)
             for start, end in allocations:
-                for j in range(start, end):
-                    self.memory[j] = None
-                partition_index = next(i for i, offset in enumerate(self.partition_offsets) if offset == start)
+                self.memory.release(start, end)
+                partition_index = self.partition_index[start]
                 self.partitions[partition_index] = None
+                self.free_partitions.release(partition_index)
+                self.internal_waste -= self.partition_sizes[partition_index] - (end - start)
+            return True
+        return self._fail(f"Process {process_id} not found in memory.")
+
+class FreeList:
+    # Free holes as disjoint [start, end) intervals. `starts` keeps them in
+    # address order and `sizes` as (size, start) pairs in size order, both
+    # searched with bisect; adjacent holes are coalesced on release. For
+    # first/next fit, `tree` is a sparse max segment tree over the address
+    # space (node -> largest hole starting in its range, absent when 0), so
+    # the leftmost hole that fits is found in O(log total_size).
+    def __init__(self, total_size):
+        self.starts = []
+        self.ends = {}
+        self.sizes = []
+        self.free_size = 0
+        self.leaves = 1 << max(0, total_size - 1).bit_length()
+        self.tree = {}
+        if total_size > 0:
+            self._add(0, total_size)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return ((start, self.ends[start]) for start in self.starts)
+
+    def _add(self, start, end):
+        insort(self.starts, start)
+        self.ends[start] = end
+        insort(self.sizes, (end - start, start))
+        self.free_size += end - start
+        self._index(start, end - start)
+
+    def _remove(self, start):
+        end = self.ends.pop(start)
+        del self.starts[bisect_left(self.starts, start)]
+        del self.sizes[bisect_left(self.sizes, (end - start, start))]
+        self.free_size -= end - start
+        self._index(start, 0)
+        return end
+
+    def _index(self, start, size):
+        tree = self.tree
+        node = self.leaves + start
+        if size:
+            tree[node] = size
         else:
-            messagebox.showerror("Error", f"Process {process_id} not found in memory.")
-
-class DynamicPartitioning(MemoryManagement):
-    def allocate(self, process_id, size, strategy='first_fit'):
+            del tree[node]
+        node //= 2
+        while node:
+            largest = max(tree.get(2 * node, 0), tree.get(2 * node + 1, 0))
+            if tree.get(node, 0) == largest:
+                # Ancestors already hold the right maximum.
+                break
+            if largest:
+                tree[node] = largest
+            else:
+                del tree[node]
+            node //= 2
+
+    def _search(self, node, low, high, position, size):
+        if high <= position or self.tree.get(node, 0) < size:
+            return None
+        if high - low == 1:
+            return low
+        middle = (low + high) // 2
+        start = self._search(2 * node, low, middle, position, size)
+        if start is None:
+            start = self._search(2 * node + 1, middle, high, position, size)
+        return start
+
+    def largest(self):
+        return self.sizes[-1][0] if self.sizes else 0
+
+    def first_fit(self, size):
+        return self.next_fit(size, 0)
+
+    def next_fit(self, size, rover):
+        # Leftmost hole that fits, starting from the one holding the rover
+        # (or the next one after it) and wrapping once.
+        if self.largest() < size:
+            return None
+        size = max(size, 1)
+        i = bisect_right(self.starts, rover) - 1
+        if i >= 0 and self.ends[self.starts[i]] > rover:
+            rover = self.starts[i]
+        start = self._search(1, 0, self.leaves, rover, size)
+        if start is None and rover:
+            start = self._search(1, 0, self.leaves, 0, size)
+        return start
+
+    def find(self, size, strategy, rover=0):
+        if size <= 0:
+            return None
         if strategy == 'first_fit':
-            for i in range(self.total_size):
-                if self.memory[i] is None:
-                    if all(self.memory[j] is None for j in range(i, i + size)):
-                        for j in range(i, i + size):
-                            self.memory[j] = process_id
-                        self.processes[process_id] = [(i, i + size)]
-                        return True
+            return self.first_fit(size)
         elif strategy == 'best_fit':
-            best_fit_index = -1
-            best_fit_size = float('inf')
-            for i in range(self.total_size):
-                if self.memory[i] is None:
-                    free_block_size = 0
-                    for j in range(i, self.total_size):
-                        if self.memory[j] is None:
-                            free_block_size += 1
-                        else:
-                            break
-                    if free_block_size >= size and free_block_size < best_fit_size:
-                        best_fit_size = free_block_size
-                        best_fit_index = i
-            if best_fit_index != -1:
-                for j in range(best_fit_index, best_fit_index + size):
-                    self.memory[j] = process_id
-                self.processes[process_id] = [(best_fit_index, best_fit_index + size)]
-                return True
+            return self.best_fit(size)
+        elif strategy == 'worst_fit':
+            return self.worst_fit(size)
         elif strategy == 'next_fit':
-            last_index = 0
-            for i in range(last_index, self.total_size):
-                if self.memory[i] is None:
-                    if all(self.memory[j] is None for j in range(i, i + size)):
-                        for j in range(i, i + size):
-                            self.memory[j] = process_id
-                        self.processes[process_id] = [(i, i + size)]
-                        last_index = i
-                        return True
-            for i in range(0, last_index):
-                if self.memory[i] is None:
-                    if all(self.memory[j] is None for j in range(i, i + size)):
-                        for j in range(i, i + size):
-                            self.memory[j] = process_id
-                        self.processes[process_id] = [(i, i + size)]
-                        last_index = i
-                        return True
-
-        messagebox.showerror("Error", f"Failed to allocate memory for Process {process_id}")
-        return False
+            return self.next_fit(size, rover)
+        return None
+
+    def best_fit(self, size):
+        i = bisect_left(self.sizes, (size, -1))
+        return self.sizes[i][1] if i < len(self.sizes) else None
+
+    def worst_fit(self, size):
+        if self.largest() < size:
+            return None
+        # Lowest address among the largest holes.
+        largest = self.sizes[-1][0]
+        return self.sizes[bisect_left(self.sizes, (largest, -1))][1]
+
+    def take(self, start, size):
+        end = self._remove(start)
+        if start + size < end:
+            self._add(start + size, end)
+
+    def release(self, start, end):
+        i = bisect_left(self.starts, start)
+        if i > 0 and self.ends[self.starts[i - 1]] == start:
+            start = self.starts[i - 1]
+            self._remove(start)
+        if end in self.ends:
+            end = self._remove(end)
+        self._add(start, end)
+
+    def fork(self):
+        # Every entry is an int or a tuple, so shallow copies are independent.
+        clone = FreeList.__new__(FreeList)
+        clone.__dict__.update(self.__dict__)
+        clone.starts = list(self.starts)
+        clone.ends = dict(self.ends)
+        clone.sizes = list(self.sizes)
+        clone.tree = dict(self.tree)
+        return clone
+
+class DynamicPartitioning(MemoryManagement):
+    def __init__(self, total_size, compact_on_failure=False, compaction_threshold=None, move_cost=1):
+        super().__init__(total_size)
+        self.free_list = FreeList(total_size)
+        # Where the last next_fit search ended: just past the last allocation.
+        self.rover = 0
+        # Compaction runs when an allocation fails although enough memory is
+        # free in total, and/or after a deallocation leaves external
+        # fragmentation above compaction_threshold (a percentage). Moving a
+        # unit of memory costs move_cost simulated time units.
+        self.compact_on_failure = compact_on_failure
+        self.compaction_threshold = compaction_threshold
+        self.move_cost = move_cost
+        self.compactions = 0
+        self.bytes_moved = 0
+        self.compaction_cost = 0
+
+    def find_hole(self, size, strategy):
+        return self.free_list.find(size, strategy, self.rover)
+
+    def allocate(self, process_id, size, strategy='first_fit'):
+        start = self.find_hole(size, strategy)
+        if start is None and self.compact_on_failure and 0 < size <= self.free_list.free_size:
+            self.compact(size)
+            start = self.find_hole(size, strategy)
+
+        if start is None:
+            return self._fail(f"Failed to allocate memory for Process {process_id}")
+
+        self.free_list.take(start, size)
+        self.rover = start + size
+        self.memory.assign(start, start + size, process_id)
+        if process_id in self.processes:
+            self.processes[process_id].append((start, start + size))
+        else:
+            self.processes[process_id] = [(start, start + size)]
+        return True
 
     def deallocate(self, process_id):
         if process_id in self.processes:
             allocations = self.processes.pop(process_id)
             for start, end in allocations:
-                for j in range(start, end):
-                    self.memory[j] = None
+                self.memory.release(start, end)
+                self.free_list.release(start, end)
+            if self.compaction_threshold is not None and self.fragmentation_stats()['external_fragmentation'] > self.compaction_threshold:
+                self.compact()
+            return True
+        return self._fail(f"Process {process_id} not found in memory.")
+
+    def compact(self, size=None):
+        # Minimal-move compaction. Sliding the live extents between holes i
+        # and j down to the start of hole i merges holes i..j into one, at
+        # the cost of moving every live unit in that window. With a size,
+        # a two-pointer pass finds the cheapest window whose holes add up
+        # to it; without one, everything is slid down into a single hole.
+        # Returns the number of units moved.
+        holes = list(self.free_list)
+        if not holes:
+            return 0
+        if size is None:
+            first, last = 0, len(holes) - 1
         else:
-            messagebox.showerror("Error", f"Process {process_id} not found in memory.")
+            best = None
+            first = 0
+            free_size = 0
+            for j, (start, end) in enumerate(holes):
+                free_size += end - start
+                while first < j and free_size - (holes[first][1] - holes[first][0]) >= size:
+                    free_size -= holes[first][1] - holes[first][0]
+                    first += 1
+                if free_size >= size:
+                    moved = end - holes[first][0] - free_size
+                    if best is None or moved < best[0]:
+                        best = (moved, first, j)
+            if best is None:
+                return 0
+            _, first, last = best
+        if first == last:
+            return 0
+
+        low, high = holes[first][0], holes[last][1]
+        for start, end in holes[first:last + 1]:
+            self.free_list.take(start, end - start)
+
+        moved = 0
+        position = low
+        window = self.memory.starts[bisect_left(self.memory.starts, low):bisect_left(self.memory.starts, high)]
+        for start in window:
+            end, process_id = self.memory.extents[start]
+            length = end - start
+            if start != position:
+                self.memory.release(start, end)
+                self.memory.assign(position, position + length, process_id)
+                allocations = self.processes[process_id]
+                allocations[allocations.index((start, end))] = (position, position + length)
+                moved += length
+            position += length
+
+        self.free_list.release(position, high)
+        if low <= self.rover < high:
+            self.rover = position
+        self.compactions += 1
+        self.bytes_moved += moved
+        self.compaction_cost += moved * self.move_cost
+        return moved
 
 class BuddySystem(MemoryManagement):
     def __init__(self, total_size):
         super().__init__(total_size)
-        self.free_blocks = {total_size: [0]}
+        # One free set per power-of-two block size, kept as an insertion-
+        # ordered dict so forks and restored snapshots hand out blocks in the
+        # same order. A total size that is not a power of two is carved into
+        # the largest aligned blocks that fit.
+        self.free_blocks = {}
+        self.block_sizes = {}
+        self.free_size = 0
+        self.free_count = 0
+        block_size = 1
+        while block_size <= total_size:
+            self.free_blocks[block_size] = {}
+            block_size *= 2
+        start = 0
+        while start < total_size:
+            block_size = 1 << ((total_size - start).bit_length() - 1)
+            if start:
+                block_size = min(block_size, start & -start)
+            self.free_blocks[block_size][start] = None
+            self.free_size += block_size
+            self.free_count += 1
+            start += block_size
 
     def allocate(self, process_id, size, strategy='first_fit'):
         block_size = 1
         while block_size < size:
             block_size *= 2
 
-        if block_size not in self.free_blocks:
-            block_size *= 2
-
-        if block_size in self.free_blocks and self.free_blocks[block_size]:
-            start = self.free_blocks[block_size].pop(0)
-            if not self.free_blocks[block_size]:
-                del self.free_blocks[block_size]
-            for i in range(start, start + size):
-                self.memory[i] = process_id
-            self.processes[process_id] = [(start, start + size)]
-            return True
+        source_size = block_size
+        while source_size in self.free_blocks and not self.free_blocks[source_size]:
+            source_size *= 2
+
+        if size <= 0 or source_size not in self.free_blocks:
+            return self._fail(f"Failed to allocate memory for Process {process_id}")
+
+        # Split the smallest free block that fits, returning the upper halves.
+        start = self.free_blocks[source_size].popitem()[0]
+        self.free_count -= 1
+        while source_size > block_size:
+            source_size //= 2
+            self.free_blocks[source_size][start + source_size] = None
+            self.free_count += 1
+        self.free_size -= block_size
+        self.block_sizes[start] = block_size
+        self.internal_waste += block_size - size
+        self.memory.assign(start, start + size, process_id)
+        if process_id in self.processes:
+            self.processes[process_id].append((start, start + size))
         else:
-            messagebox.showerror("Error", f"Failed to allocate memory for Process {process_id}")
-            return False
+            self.processes[process_id] = [(start, start + size)]
+        return True
 
     def deallocate(self, process_id):
         if process_id in self.processes:
             allocations = self.processes.pop(process_id)
             for start, end in allocations:
-                for j in range(start, end):
-                    self.memory[j] = None
-                block_size = end - start
-                if block_size in self.free_blocks:
-                    self.free_blocks[block_size].append(start)
-                else:
-                    self.free_blocks[block_size] = [start]
-        else:
-            messagebox.showerror("Error", f"Process {process_id} not found in memory.")
+                self.memory.release(start, end)
+                block_size = self.block_sizes.pop(start)
+                self.internal_waste -= block_size - (end - start)
+                self.free_size += block_size
+                self.free_count += 1
+                # Merge with the buddy (address XOR size) for as long as it is free.
+                while start ^ block_size in self.free_blocks[block_size]:
+                    del self.free_blocks[block_size][start ^ block_size]
+                    self.free_count -= 1
+                    start &= ~block_size
+                    block_size *= 2
+                self.free_blocks[block_size][start] = None
+            return True
+        return self._fail(f"Process {process_id} not found in memory.")
+
+    def free_space(self):
+        # Free blocks only merge with their buddy, so the largest hole is the
+        # largest free block, found in O(log n) over the block sizes.
+        largest_hole = next((block_size for block_size in reversed(self.free_blocks) if self.free_blocks[block_size]), 0)
+        return self.free_size, largest_hole, self.free_count
+
+class FreeFrames:
+    # Free frames as a stack: pop() hands out the most recently freed frame
+    # and take() removes a specific frame in O(1) when a contiguous run
+    # claims it. Frame 0 is handed out first. take() only unlinks the frame
+    # through `position` (frame -> its index in the stack, -1 when not free);
+    # pop() skips such stale entries, and they are swept out once they make
+    # up half the stack. Both lists are ChunkedLists, so forks are cheap.
+    def __init__(self, num_frames):
+        self.stack = ChunkedList(list(range(num_frames - 1, -1, -1)))
+        self.position = ChunkedList(list(range(num_frames - 1, -1, -1)))
+        self.count = num_frames
+
+    def __len__(self):
+        return self.count
+
+    def pop(self):
+        while True:
+            frame = self.stack.pop()
+            if self.position[frame] == len(self.stack):
+                self.position[frame] = -1
+                self.count -= 1
+                return frame
+
+    def push(self, frame):
+        self.position[frame] = len(self.stack)
+        self.stack.append(frame)
+        self.count += 1
+
+    def take(self, frame):
+        self.position[frame] = -1
+        self.count -= 1
+        if len(self.stack) > 2 * self.count + ChunkedList.SIZE:
+            frames = [frame for i, frame in enumerate(self.stack) if self.position[frame] == i]
+            self.stack = ChunkedList(frames)
+            for i, frame in enumerate(frames):
+                self.position[frame] = i
+
+    def fork(self):
+        clone = FreeFrames.__new__(FreeFrames)
+        clone.stack = self.stack.fork()
+        clone.position = self.position.fork()
+        clone.count = self.count
+        return clone
 
 class Paging(MemoryManagement):
     def __init__(self, total_size, page_size):
         super().__init__(total_size)
         self.page_size = page_size
         self.page_table = {}
+        self.num_frames = total_size // page_size
+        self.free_frames = FreeFrames(self.num_frames)
+        self.internal_fragmentation = {}
 
     def allocate(self, process_id, size, strategy='first_fit'):
         num_pages = (size + self.page_size - 1) // self.page_size
-        free_pages = [i for i in range(self.total_size // self.page_size) if all(self.memory[j] is None for j in range(i * self.page_size, (i + 1) * self.page_size))]
-        
-        if len(free_pages) < num_pages:
-            messagebox.showerror("Error", f"Not enough free pages for Process {process_id}")
-            return False
 
-        if strategy == 'first_fit':
-            allocated_pages = free_pages[:num_pages]
-        elif strategy == 'best_fit':
-            allocated_pages = free_pages[:num_pages]
-        elif strategy == 'next_fit':
-            allocated_pages = free_pages[:num_pages]
+        if num_pages <= 0 or len(self.free_frames) < num_pages:
+            return self._fail(f"Not enough free pages for Process {process_id}")
+
+        if strategy == 'contiguous':
+            # Huge-page style: one physically contiguous run of frames.
+            first = self.find_contiguous_frames(num_pages)
+            if first is None:
+                return self._fail(f"No contiguous run of {num_pages} pages for Process {process_id}")
+            allocated_pages = list(range(first, first + num_pages))
+            for page in allocated_pages:
+                self.free_frames.take(page)
+        else:
+            allocated_pages = [self.free_frames.pop() for _ in range(num_pages)]
 
         for page in allocated_pages:
-            for i in range(page * self.page_size, (page + 1) * self.page_size):
-                self.memory[i] = process_id
+            self.memory.assign(page * self.page_size, (page + 1) * self.page_size, process_id)
 
-        self.page_table[process_id] = allocated_pages
+        self.page_table.setdefault(process_id, []).extend(allocated_pages)
+        self.internal_fragmentation[process_id] = self.internal_fragmentation.get(process_id, 0) + num_pages * self.page_size - size
+        self.internal_waste += num_pages * self.page_size - size
         return True
 
+    def free_space(self):
+        # Pages need not be adjacent, so every free frame serves one request
+        # and the largest request that fits is all of free memory.
+        free_size = len(self.free_frames) * self.page_size
+        return free_size, free_size, len(self.free_frames)
+
+    def find_contiguous_frames(self, count):
+        length = count * self.page_size
+        limit = self.num_frames * self.page_size
+        position = 0
+        while True:
+            start = self.memory.find_free_run(length, position)
+            if start is None:
+                return None
+            start = -(-start // self.page_size) * self.page_size
+            if start + length > limit:
+                return None
+            position = self.memory.next_used(start, start + length)
+            if position >= start + length:
+                return start // self.page_size
+
     def deallocate(self, process_id):
         if process_id in self.page_table:
             allocated_pages = self.page_table.pop(process_id)
+            self.internal_waste -= self.internal_fragmentation.pop(process_id, 0)
             for page in allocated_pages:
-                for i in range(page * self.page_size, (page + 1) * self.page_size):
-                    self.memory[i] = None
+                self.memory.release(page * self.page_size, (page + 1) * self.page_size)
+                self.free_frames.push(page)
+            return True
+        return self._fail(f"Process {process_id} not found in memory.")
+
+class SlabAllocator(MemoryManagement):
+    # Segregated fit: requests are rounded up to a power-of-two size class
+    # and carved from slabs dedicated to that class. Each slab keeps a stack
+    # of free object slots and each class a dict of slabs with free slots, so
+    # allocate and deallocate are O(1) once a slab exists. Requests larger
+    # than the biggest class take a run of whole slabs. Empty slabs stay
+    # cached for their class until reclaim() hands them back, which happens
+    # automatically when a new slab cannot be found.
+    def __init__(self, total_size, slab_size=256, size_classes=None):
+        super().__init__(total_size)
+        self.slab_size = slab_size
+        self.num_slabs = total_size // slab_size
+        if size_classes is None:
+            size_classes = []
+            size_class = 8
+            while size_class <= slab_size // 2:
+                size_classes.append(size_class)
+                size_class *= 2
+        self.size_classes = sorted(size_classes)
+        # Every class needs at least one slot per slab; anything bigger is
+        # served as a large allocation instead.
+        if self.size_classes and not 0 < self.size_classes[0] <= self.size_classes[-1] <= slab_size:
+            raise ValueError(f"Size classes must be between 1 and the slab size {slab_size}, got {self.size_classes}.")
+        # Slab-granular ownership map: which slabs are in use (and by which
+        # size class, or by which large allocation).
+        self.slabs = MemoryMap(self.num_slabs)
+        self.partial = {size_class: {} for size_class in self.size_classes}
+        self.slab_class = {}
+        self.slab_free = {}
+        self.empty_slabs = {}
+        self.large = {}
+        # Free slots in cached slabs: only usable by their own size class.
+        self.free_slots = 0
+        self.free_slot_size = 0
+
+    def size_class(self, size):
+        i = bisect_left(self.size_classes, size)
+        return self.size_classes[i] if i < len(self.size_classes) else None
+
+    def allocate(self, process_id, size, strategy='first_fit'):
+        if size <= 0:
+            return self._fail(f"Failed to allocate memory for Process {process_id}")
+
+        size_class = self.size_class(size)
+        if size_class is None:
+            return self._allocate_large(process_id, size)
+
+        cache = self.partial[size_class]
+        if cache:
+            slab = next(reversed(cache))
+        else:
+            slab = self._new_slab(size_class)
+            if slab is None:
+                return self._fail(f"No free slab for Process {process_id}")
+
+        free_slots = self.slab_free[slab]
+        self.empty_slabs.pop(slab, None)
+        start = free_slots.pop()
+        self.free_slots -= 1
+        self.free_slot_size -= size_class
+        if not free_slots:
+            del cache[slab]
+        self.memory.assign(start, start + size, process_id)
+        self.internal_waste += size_class - size
+        if process_id in self.processes:
+            self.processes[process_id].append((start, start + size))
+        else:
+            self.processes[process_id] = [(start, start + size)]
+        return True
+
+    def _allocate_large(self, process_id, size):
+        count = (size + self.slab_size - 1) // self.slab_size
+        first = self.slabs.find_free_run(count)
+        if first is None and self.reclaim():
+            first = self.slabs.find_free_run(count)
+        if first is None:
+            return self._fail(f"No run of {count} free slabs for Process {process_id}")
+        self.slabs.assign(first, first + count, process_id)
+        start = first * self.slab_size
+        self.large[start] = count
+        self.memory.assign(start, start + size, process_id)
+        self.internal_waste += count * self.slab_size - size
+        if process_id in self.processes:
+            self.processes[process_id].append((start, start + size))
         else:
-            messagebox.showerror("Error", f"Process {process_id} not found in memory.")
+            self.processes[process_id] = [(start, start + size)]
+        return True
+
+    def _new_slab(self, size_class):
+        slab = self.slabs.find_free_run(1)
+        if slab is None and self.reclaim():
+            slab = self.slabs.find_free_run(1)
+        if slab is None:
+            return None
+        self.slabs.assign(slab, slab + 1, size_class)
+        # Slots are stacked so the lowest address is handed out first.
+        base = slab * self.slab_size
+        self.slab_class[slab] = size_class
+        self.slab_free[slab] = list(range(base + (self.slab_size // size_class - 1) * size_class, base - 1, -size_class))
+        self.partial[size_class][slab] = None
+        self.free_slots += len(self.slab_free[slab])
+        self.free_slot_size += len(self.slab_free[slab]) * size_class
+        return slab
+
+    def deallocate(self, process_id):
+        if process_id in self.processes:
+            allocations = self.processes.pop(process_id)
+            for start, end in allocations:
+                self.memory.release(start, end)
+                if start in self.large:
+                    count = self.large.pop(start)
+                    first = start // self.slab_size
+                    self.slabs.release(first, first + count)
+                    self.internal_waste -= count * self.slab_size - (end - start)
+                    continue
+                slab = start // self.slab_size
+                size_class = self.slab_class[slab]
+                self.internal_waste -= size_class - (end - start)
+                free_slots = self.slab_free[slab]
+                free_slots.append(start)
+                self.free_slots += 1
+                self.free_slot_size += size_class
+                self.partial[size_class][slab] = None
+                if len(free_slots) == self.slab_size // size_class:
+                    self.empty_slabs[slab] = None
+            return True
+        return self._fail(f"Process {process_id} not found in memory.")
+
+    def reclaim(self):
+        # Return every cached empty slab to the free pool.
+        reclaimed = len(self.empty_slabs)
+        for slab in self.empty_slabs:
+            size_class = self.slab_class.pop(slab)
+            del self.partial[size_class][slab]
+            slots = len(self.slab_free.pop(slab))
+            self.free_slots -= slots
+            self.free_slot_size -= slots * size_class
+            self.slabs.release(slab, slab + 1)
+        self.empty_slabs.clear()
+        return reclaimed
+
+    def free_space(self):
+        # Runs of free slabs plus the free slots of cached slabs. When no
+        # slab is free the largest hole is the largest class with a slot.
+        largest_hole = self.slabs.largest_hole() * self.slab_size
+        if not largest_hole:
+            largest_hole = max((size_class for size_class, cache in self.partial.items() if cache), default=0)
+        free_size = self.slabs.free_size * self.slab_size + self.free_slot_size
+        return free_size, largest_hole, len(self.slabs.hole_sizes) + self.free_slots
+
+class Segmentation(MemoryManagement):
+    # Per-process segment tables: process_id -> {segment: entry}. Without a
+    # page size every segment is one contiguous extent ({'base', 'limit'})
+    # placed with the FreeList strategies; with one, segments are paged
+    # ({'pages', 'limit'}) and take frames from a FreeFrames stack like
+    # Paging. allocate() adds memory to one segment, growing it if it exists.
+    SEGMENTS = ('code', 'data', 'stack', 'heap')
+
+    def __init__(self, total_size, page_size=None, lookup_time=1):
+        super().__init__(total_size)
+        self.page_size = page_size
+        self.segment_tables = {}
+        if page_size:
+            self.num_frames = total_size // page_size
+            self.free_frames = FreeFrames(self.num_frames)
+        else:
+            self.free_list = FreeList(total_size)
+            self.rover = 0
+        # Each table walk (segment table, then page table when paged) costs
+        # lookup_time simulated time units.
+        self.lookup_time = lookup_time
+        self.translations = 0
+        self.translation_cost = 0
+        self.bytes_moved = 0
+
+    def allocate(self, process_id, size, strategy='first_fit', segment='heap'):
+        if segment not in self.SEGMENTS:
+            return self._fail(f"Unknown segment {segment!r}; expected one of {self.SEGMENTS}")
+        if size <= 0:
+            return self._fail(f"Failed to allocate memory for Process {process_id}")
+
+        table = self.segment_tables.get(process_id, {})
+        if self.page_size:
+            grown = self._grow_paged(process_id, table, segment, size)
+        else:
+            grown = self._grow_contiguous(process_id, table, segment, size, strategy)
+        if not grown:
+            return self._fail(f"Failed to grow the {segment} segment of Process {process_id} by {size}")
+        self.segment_tables[process_id] = table
+        return True
+
+    def load_process(self, process_id, code=0, data=0, stack=0, heap=0, strategy='first_fit'):
+        # All or nothing: a process image that does not fit is unloaded again.
+        if process_id in self.segment_tables:
+            return self._fail(f"Process {process_id} is already loaded.")
+        for segment, size in zip(self.SEGMENTS, (code, data, stack, heap)):
+            if size > 0 and not self.allocate(process_id, size, strategy, segment):
+                error = self.last_error
+                if process_id in self.segment_tables:
+                    self.deallocate(process_id)
+                return self._fail(error)
+        return True
+
+    def _grow_contiguous(self, process_id, table, segment, size, strategy):
+        entry = table.get(segment)
+        if entry is None:
+            start = self.free_list.find(size, strategy, self.rover)
+            if start is None:
+                return False
+            self.free_list.take(start, size)
+            self.rover = start + size
+            self.memory.assign(start, start + size, process_id)
+            table[segment] = {'base': start, 'limit': size}
+            self.processes.setdefault(process_id, []).append((start, start + size))
+            return True
+
+        base, limit = entry['base'], entry['limit']
+        end = base + limit
+        if self.free_list.ends.get(end, end) - end >= size:
+            # The hole right after the segment is big enough: grow in place.
+            self.free_list.take(end, size)
+            new_base = base
+        else:
+            # Otherwise move the whole segment to a hole that fits it.
+            new_base = self.free_list.find(limit + size, strategy, self.rover)
+            if new_base is None:
+                return False
+            self.free_list.take(new_base, limit + size)
+            self.free_list.release(base, end)
+            self.bytes_moved += limit
+        self.memory.release(base, end)
+        self.memory.assign(new_base, new_base + limit + size, process_id)
+        extents = self.processes[process_id]
+        extents[extents.index((base, end))] = (new_base, new_base + limit + size)
+        entry['base'] = new_base
+        entry['limit'] = limit + size
+        return True
+
+    def _grow_paged(self, process_id, table, segment, size):
+        entry = table.get(segment, {'pages': [], 'limit': 0})
+        pages, limit = entry['pages'], entry['limit']
+        needed = (limit + size + self.page_size - 1) // self.page_size - len(pages)
+        if needed > len(self.free_frames):
+            return False
+        for _ in range(needed):
+            frame = self.free_frames.pop()
+            pages.append(frame)
+            self.memory.assign(frame * self.page_size, (frame + 1) * self.page_size, process_id)
+            self.processes.setdefault(process_id, []).append((frame * self.page_size, (frame + 1) * self.page_size))
+        # Growing into the slack of the last page uses up internal waste.
+        self.internal_waste += needed * self.page_size - size
+        entry['limit'] = limit + size
+        table[segment] = entry
+        return True
+
+    def free_space(self):
+        # Paged segments take any free frames, like Paging.
+        if self.page_size:
+            free_size = len(self.free_frames) * self.page_size
+            return free_size, free_size, len(self.free_frames)
+        return super().free_space()
+
+    def translate(self, process_id, segment, offset):
+        # Logical (segment, offset) -> (physical address, lookup cost), or
+        # False on a segmentation fault.
+        entry = self.segment_tables.get(process_id, {}).get(segment)
+        if entry is None or not 0 <= offset < entry['limit']:
+            return self._fail(f"Segmentation fault: Process {process_id} {segment}+{offset}")
+        cost = self.lookup_time
+        if self.page_size:
+            cost += self.lookup_time
+            address = entry['pages'][offset // self.page_size] * self.page_size + offset % self.page_size
+        else:
+            address = entry['base'] + offset
+        self.translations += 1
+        self.translation_cost += cost
+        return address, cost
+
+    def deallocate(self, process_id):
+        if process_id in self.segment_tables:
+            table = self.segment_tables.pop(process_id)
+            for start, end in self.processes.pop(process_id, []):
+                self.memory.release(start, end)
+                if self.page_size:
+                    self.free_frames.push(start // self.page_size)
+                else:
+                    self.free_list.release(start, end)
+            if self.page_size:
+                self.internal_waste -= sum(len(entry['pages']) * self.page_size - entry['limit'] for entry in table.values())
+            return True
+        return self._fail(f"Process {process_id} not found in memory.")
 
 class MemoryManagementSimulator:
+    # Thin tkinter front end over the headless allocators above. tkinter and
+    # matplotlib are imported lazily so scripts and worker processes that only
+    # use the allocators never load them.
     def __init__(self, master):
+        import tkinter as tk
+        import tkinter.ttk as ttk
+
         self.master = master
         self.master.title("Memory Management Simulator")
         self.mm = None
@@ -382,7 +1425,7 @@ class MemoryManagementSimulator:
         self.technique_var = tk.StringVar(value="fixed")
         self.technique_label = ttk.Label(frame, text="Memory Management Technique:")
         self.technique_label.grid(row=0, column=0, pady=5, sticky=tk.W)
-        self.technique_menu = ttk.OptionMenu(frame, self.technique_var, "fixed", "fixed", "unequal", "dynamic", "buddy", "paging")
+        self.technique_menu = ttk.OptionMenu(frame, self.technique_var, "fixed", "fixed", "unequal", "dynamic", "buddy", "paging", "slab", "segmentation")
         self.technique_menu.grid(row=0, column=1, pady=5, sticky=tk.EW)
 
         self.total_memory_label = ttk.Label(frame, text="Total Memory Size:")
@@ -390,12 +1433,12 @@ class MemoryManagementSimulator:
         self.total_memory_entry = ttk.Entry(frame)
         self.total_memory_entry.grid(row=1, column=1, pady=5, sticky=tk.EW)
 
-        self.partition_label = ttk.Label(frame, text="Partition Size (fixed/unequal):")
+        self.partition_label = ttk.Label(frame, text="Partition Size (fixed/unequal/slab):")
         self.partition_label.grid(row=2, column=0, pady=5, sticky=tk.W)
         self.partition_entry = ttk.Entry(frame)
         self.partition_entry.grid(row=2, column=1, pady=5, sticky=tk.EW)
 
-        self.page_size_label = ttk.Label(frame, text="Page Size (paging):")
+        self.page_size_label = ttk.Label(frame, text="Page Size (paging, optional for segmentation):")
         self.page_size_label.grid(row=3, column=0, pady=5, sticky=tk.W)
         self.page_size_entry = ttk.Entry(frame)
         self.page_size_entry.grid(row=3, column=1, pady=5, sticky=tk.EW)
@@ -432,6 +1475,8 @@ class MemoryManagementSimulator:
         self.comparison_button.grid(row=11, column=0, columnspan=2, pady=5, sticky=tk.EW)
 
     def setup_memory_management(self):
+        from tkinter import messagebox
+
         total_memory = int(self.total_memory_entry.get())
         self.total_memory = total_memory
         technique = self.technique_var.get()
@@ -449,6 +1494,13 @@ class MemoryManagementSimulator:
         elif technique == "paging":
             page_size = int(self.page_size_entry.get())
             self.mm = Paging(total_memory, page_size)
+        elif technique == "slab":
+            slab_size = int(self.partition_entry.get())
+            self.mm = SlabAllocator(total_memory, slab_size)
+        elif technique == "segmentation":
+            # A page size switches to paged segmentation.
+            page_size = int(self.page_size_entry.get() or 0)
+            self.mm = Segmentation(total_memory, page_size or None)
         else:
             messagebox.showerror("Error", "Invalid memory management technique.")
             return
@@ -456,6 +1508,8 @@ class MemoryManagementSimulator:
         messagebox.showinfo("Info", f"Memory Management System initialized with {technique} technique.")
 
     def allocate_memory(self):
+        from tkinter import messagebox
+
         if self.mm is None:
             messagebox.showerror("Error", "Memory management system not initialized.")
             return
@@ -464,22 +1518,28 @@ class MemoryManagementSimulator:
         process_size = int(self.process_size_entry.get())
 
         if self.mm.allocate(process_id, process_size):
-            
             self.successful_allocations += 1
+        else:
+            messagebox.showerror("Error", self.mm.last_error)
         self.allocation_attempts += 1
 
         efficiency = (self.successful_allocations / self.allocation_attempts) * 100
         self.algorithm_efficiency[self.technique_var.get()] = efficiency
 
     def deallocate_memory(self):
+        from tkinter import messagebox
+
         if self.mm is None:
             messagebox.showerror("Error", "Memory management system not initialized.")
             return
 
         process_id = int(self.process_id_entry.get())
-        self.mm.deallocate(process_id)
+        if not self.mm.deallocate(process_id):
+            messagebox.showerror("Error", self.mm.last_error)
 
     def display_memory(self):
+        from tkinter import messagebox
+
         if self.mm is None:
             messagebox.showerror("Error", "Memory management system not initialized.")
             return
@@ -488,6 +1548,8 @@ class MemoryManagementSimulator:
         messagebox.showinfo("Memory Status", memory_status)
 
     def calculate_fragmentation(self):
+        from tkinter import messagebox
+
         if self.mm is None:
             messagebox.showerror("Error", "Memory management system not initialized.")
             return
@@ -496,6 +1558,10 @@ class MemoryManagementSimulator:
         messagebox.showinfo("Fragmentation", f"Memory fragmentation: {fragmentation:.2f}%")
 
     def visualize_memory(self):
+        import tkinter as tk
+        from tkinter import messagebox
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         if self.mm is None:
             messagebox.showerror("Error", "Memory management system not initialized.")
             return
@@ -510,6 +1576,10 @@ class MemoryManagementSimulator:
         root.mainloop()
 
     def compare_algorithms(self):
+        import tkinter as tk
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         labels = list(self.algorithm_efficiency.keys())
         efficiencies = list(self.algorithm_efficiency.values())
 
@@ -531,6 +1601,8 @@ class MemoryManagementSimulator:
         root.mainloop()
 
 if __name__ == "__main__":
+    import tkinter as tk
+
     root = tk.Tk()
     app = MemoryManagementSimulator(root)
     root.mainloop()
@@ -0,0 +1,213 @@
+import argparse
+import csv
+import itertools
+import json
+import math
+import random
+import sys
+import time
+from array import array
+from Memory_Management import FixedSizePartitioning, UnequalSizePartitioning, DynamicPartitioning, BuddySystem, Paging, SlabAllocator, Segmentation
+
+STRATEGIES = {
+    "fixed": ("first_fit", "best_fit", "next_fit", "worst_fit"),
+    "unequal": ("first_fit", "best_fit", "next_fit", "worst_fit"),
+    "dynamic": ("first_fit", "best_fit", "next_fit", "worst_fit"),
+    "buddy": ("first_fit",),
+    "paging": ("first_fit", "contiguous"),
+    "slab": ("first_fit",),
+    "segmentation": ("first_fit", "best_fit", "next_fit", "worst_fit"),
+    "paged_segmentation": ("first_fit",),
+}
+SIZE_DISTRIBUTIONS = ("uniform", "exponential", "small_objects")
+
+def build_allocator(technique, total_size, partition_size=64, partition_sizes=None, page_size=16, compact_on_failure=False, compaction_threshold=None, slab_size=256):
+    if technique == "fixed":
+        return FixedSizePartitioning(total_size, partition_size)
+    if technique == "unequal":
+        if partition_sizes is None:
+            partition_sizes = default_partition_sizes(total_size, partition_size)
+        return UnequalSizePartitioning(total_size, partition_sizes)
+    if technique == "dynamic":
+        return DynamicPartitioning(total_size, compact_on_failure, compaction_threshold)
+    if technique == "buddy":
+        return BuddySystem(total_size)
+    if technique == "paging":
+        return Paging(total_size, page_size)
+    if technique == "slab":
+        return SlabAllocator(total_size, slab_size)
+    if technique == "segmentation":
+        return Segmentation(total_size)
+    if technique == "paged_segmentation":
+        return Segmentation(total_size, page_size)
+    raise ValueError(f"Unknown memory management technique {technique!r}")
+
+def default_partition_sizes(total_size, partition_size):
+    # Cycle half, single and double partitions until memory is used up.
+    sizes = []
+    remaining = total_size
+    for factor in itertools.cycle((0.5, 1, 2)):
+        size = max(1, int(partition_size * factor))
+        if size > remaining:
+            break
+        sizes.append(size)
+        remaining -= size
+    return sizes
+
+def generate_trace(n, seed=0, mean_size=32, distribution="uniform", free_probability=0.45, max_live=None):
+    # Trace operations are ("alloc", process_id, size) and ("free", process_id, 0).
+    # Capping the live set keeps long traces at a steady memory load.
+    if distribution not in SIZE_DISTRIBUTIONS:
+        raise ValueError(f"Unknown size distribution {distribution!r}; expected one of {SIZE_DISTRIBUTIONS}")
+    rng = random.Random(seed)
+    live = []
+    next_id = 0
+    for _ in range(n):
+        if live and (rng.random() < free_probability or max_live is not None and len(live) >= max_live):
+            i = rng.randrange(len(live))
+            live[i], live[-1] = live[-1], live[i]
+            yield ("free", live.pop(), 0)
+            continue
+        if distribution == "uniform":
+            size = rng.randint(1, 2 * mean_size - 1)
+        elif distribution == "exponential":
+            size = max(1, round(rng.expovariate(1 / mean_size)))
+        else:
+            # Mostly tiny objects with an occasional large buffer.
+            size = rng.randint(1, 16) if rng.random() < 0.95 else rng.randint(mean_size, 8 * mean_size)
+        live.append(next_id)
+        yield ("alloc", next_id, size)
+        next_id += 1
+
+def write_trace(path, trace):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["op", "process_id", "size"])
+        writer.writerows(trace)
+
+def read_trace(path):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return [(op, int(process_id), int(size)) for op, process_id, size in reader]
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p * len(ordered) / 100) - 1)]
+
+def replay(mm, trace, strategy, sample_every=1, live=None):
+    alloc_latency = array('d')
+    free_latency = array('d')
+    failures = 0
+    allocations = 0
+    peak_fragmentation = 0.0
+    peak_internal = 0
+    # live carries the successful allocations over when replay continues
+    # from a forked, already warm allocator.
+    live = set() if live is None else live
+    clock = time.perf_counter
+
+    started = clock()
+    for i, (op, process_id, size) in enumerate(trace):
+        if op == "alloc":
+            allocations += 1
+            before = clock()
+            ok = mm.allocate(process_id, size, strategy)
+            alloc_latency.append(clock() - before)
+            if ok:
+                live.add(process_id)
+            else:
+                failures += 1
+        elif process_id in live:
+            # Frees of allocations that failed are skipped, not counted.
+            live.discard(process_id)
+            before = clock()
+            mm.deallocate(process_id)
+            free_latency.append(clock() - before)
+        if sample_every and i % sample_every == 0:
+            stats = mm.fragmentation_stats()
+            peak_fragmentation = max(peak_fragmentation, stats['external_fragmentation'])
+            peak_internal = max(peak_internal, stats['internal_fragmentation'])
+    elapsed = clock() - started
+
+    operations = len(alloc_latency) + len(free_latency)
+    result = {
+        "operations": operations,
+        "ops_per_sec": operations / elapsed if elapsed > 0 else 0.0,
+        "alloc_p99_us": percentile(alloc_latency, 99) * 1e6,
+        "free_p99_us": percentile(free_latency, 99) * 1e6,
+        "failure_rate": failures / allocations if allocations else 0.0,
+        "peak_fragmentation": peak_fragmentation,
+        "peak_internal_fragmentation": peak_internal,
+    }
+    if hasattr(mm, "compactions"):
+        result.update(compactions=mm.compactions, bytes_moved=mm.bytes_moved, compaction_cost=mm.compaction_cost)
+    return result
+
+def run_benchmark(trace, techniques, total_size, partition_size=64, partition_sizes=None, page_size=16, sample_every=1, compact_on_failure=False, compaction_threshold=None, slab_size=256, warmup=0):
+    # With warmup, the first `warmup` operations are replayed once per
+    # technique with its first strategy, and every strategy then continues
+    # from a fork of that warm state instead of replaying from scratch.
+    trace = list(trace)
+    results = []
+    for technique in techniques:
+        warm = build_allocator(technique, total_size, partition_size, partition_sizes, page_size, compact_on_failure, compaction_threshold, slab_size)
+        warm_live = set()
+        if warmup:
+            replay(warm, trace[:warmup], STRATEGIES[technique][0], 0, warm_live)
+        for strategy in STRATEGIES[technique]:
+            mm = warm.fork()
+            result = {"technique": technique, "strategy": strategy}
+            result.update(replay(mm, trace[warmup:], strategy, sample_every, set(warm_live)))
+            results.append(result)
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay alloc/free traces against every memory management technique.")
+    parser.add_argument("--total-size", type=int, default=4096)
+    parser.add_argument("--partition-size", type=int, default=64)
+    parser.add_argument("--partition-sizes", help="comma separated sizes for unequal partitioning")
+    parser.add_argument("--page-size", type=int, default=16)
+    parser.add_argument("--slab-size", type=int, default=256)
+    parser.add_argument("--techniques", nargs="+", choices=sorted(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--ops", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mean-size", type=int, default=32)
+    parser.add_argument("--distribution", choices=SIZE_DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--load", type=float, default=0.75, help="cap live allocations at about this fraction of memory")
+    parser.add_argument("--sample-every", type=int, default=1, help="sample fragmentation every N operations (0 disables)")
+    parser.add_argument("--compact-on-failure", action="store_true", help="compact dynamic partitions when an allocation fails")
+    parser.add_argument("--compaction-threshold", type=float, help="compact dynamic partitions above this external fragmentation (%%)")
+    parser.add_argument("--warmup", type=int, default=0, help="replay this many operations once per technique and fork every strategy from there")
+    parser.add_argument("--trace", help="replay this CSV trace instead of generating one")
+    parser.add_argument("--write-trace", help="save the generated trace to this CSV file")
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        trace = read_trace(args.trace)
+    else:
+        max_live = max(1, int(args.load * args.total_size / args.mean_size))
+        trace = list(generate_trace(args.ops, args.seed, args.mean_size, args.distribution, max_live=max_live))
+        if args.write_trace:
+            write_trace(args.write_trace, trace)
+    partition_sizes = list(map(int, args.partition_sizes.split(','))) if args.partition_sizes else None
+
+    report = {
+        "total_size": args.total_size,
+        "operations": len(trace),
+        "warmup": args.warmup,
+        "trace": args.trace or {"seed": args.seed, "mean_size": args.mean_size, "distribution": args.distribution, "load": args.load},
+        "results": run_benchmark(trace, args.techniques, args.total_size, args.partition_size, partition_sizes, args.page_size, args.sample_every, args.compact_on_failure, args.compaction_threshold, args.slab_size, args.warmup),
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+if __name__ == "__main__":
+    main()
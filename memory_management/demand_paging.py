@@ -0,0 +1,256 @@
+import heapq
+import random
+from array import array
+from collections import OrderedDict, deque
+
+NEVER = float('inf')
+
+
+class FIFOPolicy:
+    needs_future = False
+
+    def __init__(self):
+        self.queue = deque()
+
+    def prepare(self, trace, page_size):
+        pass
+
+    def touch(self, key, position):
+        pass
+
+    def insert(self, key, position):
+        self.queue.append(key)
+
+    def evict(self):
+        return self.queue.popleft()
+
+
+class LRUPolicy(FIFOPolicy):
+    def __init__(self):
+        self.pages = OrderedDict()
+
+    def touch(self, key, position):
+        self.pages.move_to_end(key)
+
+    def insert(self, key, position):
+        self.pages[key] = None
+
+    def evict(self):
+        return self.pages.popitem(last=False)[0]
+
+
+class SecondChancePolicy(FIFOPolicy):
+    # FIFO queue where a referenced page is cleared and sent to the back
+    # once instead of being evicted.
+    def __init__(self):
+        super().__init__()
+        self.referenced = {}
+
+    def touch(self, key, position):
+        self.referenced[key] = True
+
+    def insert(self, key, position):
+        self.queue.append(key)
+        self.referenced[key] = False
+
+    def evict(self):
+        while True:
+            key = self.queue.popleft()
+            if not self.referenced[key]:
+                del self.referenced[key]
+                return key
+            self.referenced[key] = False
+            self.queue.append(key)
+
+
+class ClockPolicy(FIFOPolicy):
+    # Second chance on a fixed ring of slots: the hand sweeps clearing
+    # reference bits and the new page takes the victim's slot.
+    def __init__(self):
+        self.ring = []
+        self.referenced = []
+        self.slot = {}
+        self.hand = 0
+        self.vacant = None
+
+    def touch(self, key, position):
+        self.referenced[self.slot[key]] = True
+
+    def insert(self, key, position):
+        if self.vacant is None:
+            self.slot[key] = len(self.ring)
+            self.ring.append(key)
+            self.referenced.append(False)
+        else:
+            self.slot[key] = self.vacant
+            self.ring[self.vacant] = key
+            self.referenced[self.vacant] = False
+            self.vacant = None
+
+    def evict(self):
+        while self.referenced[self.hand]:
+            self.referenced[self.hand] = False
+            self.hand = (self.hand + 1) % len(self.ring)
+        key = self.ring[self.hand]
+        del self.slot[key]
+        self.vacant = self.hand
+        self.hand = (self.hand + 1) % len(self.ring)
+        return key
+
+
+class OPTPolicy(FIFOPolicy):
+    # Belady's optimal policy: evict the resident page used furthest in the
+    # future. next_use is precomputed in one backward pass over the trace and
+    # resident pages sit in a max-heap on it; stale heap entries are skipped.
+    needs_future = True
+
+    def __init__(self):
+        self.next_use = None
+        self.resident = {}
+        self.heap = []
+
+    def prepare(self, trace, page_size):
+        self.next_use = array('d', bytes(8 * len(trace)))
+        last = {}
+        for position in range(len(trace) - 1, -1, -1):
+            process_id, address = trace[position]
+            key = (process_id, address // page_size)
+            self.next_use[position] = last.get(key, NEVER)
+            last[key] = position
+
+    def touch(self, key, position):
+        self.insert(key, position)
+
+    def insert(self, key, position):
+        if self.next_use is None:
+            raise ValueError("OPT needs the whole trace up front; drive it with DemandPaging.run().")
+        upcoming = self.next_use[position]
+        self.resident[key] = upcoming
+        heapq.heappush(self.heap, (-upcoming, position, key))
+        if len(self.heap) > 4 * len(self.resident) + 64:
+            self.heap = [(-upcoming, i, key) for i, (key, upcoming) in enumerate(self.resident.items())]
+            heapq.heapify(self.heap)
+
+    def evict(self):
+        while True:
+            upcoming, _, key = heapq.heappop(self.heap)
+            if self.resident.get(key) == -upcoming:
+                del self.resident[key]
+                return key
+
+
+POLICIES = {
+    'fifo': FIFOPolicy,
+    'lru': LRUPolicy,
+    'second_chance': SecondChancePolicy,
+    'clock': ClockPolicy,
+    'opt': OPTPolicy,
+}
+
+
+class DemandPaging:
+    def __init__(self, num_frames, page_size, policy='lru', tlb_size=16, tlb_time=1, memory_time=100, fault_time=100000):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown replacement policy {policy!r}; expected one of {sorted(POLICIES)}")
+        if num_frames <= 0:
+            raise ValueError("Demand paging needs at least one frame.")
+        self.num_frames = num_frames
+        self.page_size = page_size
+        self.policy = POLICIES[policy]()
+        self.tlb_size = tlb_size
+        self.tlb_time = tlb_time
+        self.memory_time = memory_time
+        self.fault_time = fault_time
+
+        # Per-process virtual page tables: process_id -> {page: frame}.
+        self.page_tables = {}
+        self.frame_owner = {}
+        self.free_frames = list(range(num_frames - 1, -1, -1))
+        self.tlb = OrderedDict()
+
+        self.references = 0
+        self.faults = 0
+        self.evictions = 0
+        self.tlb_hits = 0
+        self.access_time = 0
+
+    def access(self, process_id, address, position=None):
+        page = address // self.page_size
+        key = (process_id, page)
+        self.references += 1
+
+        if key in self.tlb:
+            self.tlb.move_to_end(key)
+            self.tlb_hits += 1
+            self.policy.touch(key, position)
+            self.access_time += self.tlb_time + self.memory_time
+            return True
+
+        # TLB miss: walk the page table, then access memory.
+        self.access_time += self.tlb_time + 2 * self.memory_time
+        page_table = self.page_tables.setdefault(process_id, {})
+        hit = page in page_table
+        if hit:
+            self.policy.touch(key, position)
+        else:
+            self.faults += 1
+            self.access_time += self.fault_time
+            if self.free_frames:
+                frame = self.free_frames.pop()
+            else:
+                frame = self._evict()
+            page_table[page] = frame
+            self.frame_owner[frame] = key
+            self.policy.insert(key, position)
+
+        if self.tlb_size:
+            if len(self.tlb) >= self.tlb_size:
+                self.tlb.popitem(last=False)
+            self.tlb[key] = page_table[page]
+        return hit
+
+    def _evict(self):
+        victim_process, victim_page = victim = self.policy.evict()
+        frame = self.page_tables[victim_process].pop(victim_page)
+        del self.frame_owner[frame]
+        # TLB shootdown for the evicted mapping.
+        self.tlb.pop(victim, None)
+        self.evictions += 1
+        return frame
+
+    def run(self, trace):
+        # trace: iterable of (process_id, virtual_address) references. Only
+        # OPT needs it materialised; every other policy streams it.
+        if self.policy.needs_future:
+            trace = list(trace)
+            self.policy.prepare(trace, self.page_size)
+        for position, (process_id, address) in enumerate(trace):
+            self.access(process_id, address, position)
+        return self.stats()
+
+    def stats(self):
+        references = self.references or 1
+        return {
+            'references': self.references,
+            'faults': self.faults,
+            'evictions': self.evictions,
+            'fault_rate': self.faults / references,
+            'tlb_hits': self.tlb_hits,
+            'tlb_hit_rate': self.tlb_hits / references,
+            'effective_access_time': self.access_time / references,
+        }
+
+
+def generate_reference_trace(n, processes=4, pages_per_process=256, page_size=4096, working_set=16, locality=0.9, seed=0):
+    # Each process mostly references a drifting working set of pages and
+    # occasionally jumps anywhere in its address space.
+    rng = random.Random(seed)
+    bases = [0] * processes
+    for _ in range(n):
+        process_id = rng.randrange(processes)
+        if rng.random() < locality:
+            page = (bases[process_id] + rng.randrange(working_set)) % pages_per_process
+        else:
+            page = rng.randrange(pages_per_process)
+            bases[process_id] = page
+        yield process_id, page * page_size + rng.randrange(page_size)
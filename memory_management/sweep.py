@@ -0,0 +1,120 @@
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from benchmark import STRATEGIES, SIZE_DISTRIBUTIONS, build_allocator, generate_trace, replay
+
+# Techniques whose unit size is swept: the partition size for fixed and
+# unequal partitioning, the slab size for slab, and the page size for the
+# paged techniques. The others get a single cell per total size.
+UNIT_TECHNIQUES = ("fixed", "unequal", "slab", "paging", "paged_segmentation")
+# Bump when a change to the allocators or the benchmark invalidates cached cells.
+CACHE_VERSION = 3
+COLUMNS = ("technique", "strategy", "total_size", "unit_size", "seed", "operations", "ops_per_sec",
+           "alloc_p99_us", "free_p99_us", "failure_rate", "peak_fragmentation", "peak_internal_fragmentation")
+
+def sweep_cells(techniques, total_sizes, unit_sizes, seeds):
+    for technique in techniques:
+        units = unit_sizes if technique in UNIT_TECHNIQUES else (None,)
+        for strategy, total_size, unit_size, seed in itertools.product(STRATEGIES[technique], total_sizes, units, seeds):
+            yield {"technique": technique, "strategy": strategy, "total_size": total_size, "unit_size": unit_size, "seed": seed}
+
+def cell_key(cell, workload):
+    text = json.dumps({"version": CACHE_VERSION, "cell": cell, "workload": workload}, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+@lru_cache(maxsize=8)
+def _trace(ops, seed, mean_size, distribution, max_live):
+    # Cells that share a seed and total size replay the same trace, so each
+    # worker builds it once.
+    return list(generate_trace(ops, seed, mean_size, distribution, max_live=max_live))
+
+def run_cell(cell, workload):
+    technique, total_size, unit_size = cell["technique"], cell["total_size"], cell["unit_size"]
+    max_live = max(1, int(workload["load"] * total_size / workload["mean_size"]))
+    trace = _trace(workload["ops"], cell["seed"], workload["mean_size"], workload["distribution"], max_live)
+    if technique in ("fixed", "unequal"):
+        mm = build_allocator(technique, total_size, partition_size=unit_size)
+    elif technique == "slab":
+        mm = build_allocator(technique, total_size, slab_size=unit_size)
+    elif technique in UNIT_TECHNIQUES:
+        mm = build_allocator(technique, total_size, page_size=unit_size)
+    else:
+        mm = build_allocator(technique, total_size)
+    result = dict(cell)
+    result.update(replay(mm, trace, cell["strategy"], workload["sample_every"]))
+    return result
+
+def run_sweep(cells, workload, cache_dir=None, max_workers=None):
+    # Cells already in the cache are read back; the rest are fanned out over
+    # a process pool and cached as they finish, so an interrupted sweep
+    # keeps its progress.
+    results = {}
+    pending = []
+    for cell in cells:
+        key = cell_key(cell, workload)
+        path = os.path.join(cache_dir, key + ".json") if cache_dir else None
+        if path and os.path.exists(path):
+            with open(path) as f:
+                results[key] = json.load(f)
+        else:
+            pending.append((key, path, cell))
+
+    if pending:
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = {executor.submit(run_cell, cell, workload): (key, path) for key, path, cell in pending}
+            for future in as_completed(futures):
+                key, path = futures[future]
+                results[key] = future.result()
+                if path:
+                    with open(path + ".tmp", "w") as f:
+                        json.dump(results[key], f)
+                    os.replace(path + ".tmp", path)
+
+    table = [results[cell_key(cell, workload)] for cell in cells]
+    return table, len(table) - len(pending)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep memory techniques, strategies and sizes over a process pool.")
+    parser.add_argument("--techniques", nargs="+", choices=sorted(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--total-sizes", type=int, nargs="+", default=[4096, 16384])
+    parser.add_argument("--unit-sizes", type=int, nargs="+", default=[16, 64, 256], help="partition, slab or page sizes")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--ops", type=int, default=10000)
+    parser.add_argument("--mean-size", type=int, default=32)
+    parser.add_argument("--distribution", choices=SIZE_DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--load", type=float, default=0.75)
+    parser.add_argument("--sample-every", type=int, default=1)
+    parser.add_argument("--cache-dir", default=".sweep_cache", help="directory of finished cells ('' disables caching)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="write the table as CSV here instead of printing it")
+    args = parser.parse_args(argv)
+
+    workload = {"ops": args.ops, "mean_size": args.mean_size, "distribution": args.distribution,
+                "load": args.load, "sample_every": args.sample_every}
+    cells = list(sweep_cells(args.techniques, args.total_sizes, args.unit_sizes, args.seeds))
+    table, cached = run_sweep(cells, workload, args.cache_dir or None, args.workers)
+    print(f"{len(table)} cells, {cached} from cache", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            writer = csv.DictWriter(f, COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(table)
+        return
+
+    print(f"{'Technique':<20}{'Strategy':<12}{'Total':>8}{'Unit':>6}{'Seed':>6}{'Ops/sec':>12}{'Alloc p99 us':>14}{'Failures':>10}{'Peak frag %':>13}")
+    for row in table:
+        unit = "-" if row["unit_size"] is None else row["unit_size"]
+        print(f"{row['technique']:<20}{row['strategy']:<12}{row['total_size']:>8}{unit:>6}{row['seed']:>6}{row['ops_per_sec']:>12.0f}"
+              f"{row['alloc_p99_us']:>14.2f}{row['failure_rate']:>10.3f}{row['peak_fragmentation']:>13.2f}")
+
+if __name__ == "__main__":
+    main()